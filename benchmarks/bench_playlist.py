@@ -0,0 +1,101 @@
+"""Time and memory-profile the playlist transforms on synthetic Twitch VOD playlists.
+
+Usage:
+    python benchmarks/bench_playlist.py [--sizes 1000,10000,50000] [--fmp4] [--repeat N]
+
+Playlists carry the Twitch header tags (#EXT-X-TWITCH-TOTAL-SECS), an
+#ID3-EQUIV-TDTG timestamp every 100 segments, a 30 segment muted run every 500
+segments and, with --fmp4, an #EXT-X-MAP init segment. 50k segments of 10 s is
+roughly a 139 hour VOD, well past the 48 hour case. mark_invalid_segment_lines
+only handles .ts segments, so it is reported as n/a for --fmp4.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import vod_recovery
+
+BASE_LINK = "https://d2nvs31859zcd8.cloudfront.net/0123456789abcdef0123_benchstreamer_40000000000_1704110400/chunked/"
+MUTED_EVERY = 500
+MUTED_RUN = 30
+ID3_EVERY = 100
+START_TIME = datetime.datetime(2024, 1, 1, 12, 0, 0)
+
+
+def build_playlist(size, fmp4=False):
+    extension = ".mp4" if fmp4 else ".ts"
+    lines = [
+        "#EXTM3U\n",
+        "#EXT-X-VERSION:3\n",
+        "#EXT-X-TARGETDURATION:10\n",
+        "#EXT-X-PLAYLIST-TYPE:EVENT\n",
+        "#EXT-X-MEDIA-SEQUENCE:0\n",
+        "#EXT-X-TWITCH-ELAPSED-SECS:0.000\n",
+        f"#EXT-X-TWITCH-TOTAL-SECS:{size * 10}.000\n",
+    ]
+    if fmp4:
+        lines.append('#EXT-X-MAP:URI="init-0.mp4"\n')
+    for index in range(size):
+        if index % ID3_EVERY == 0:
+            lines.append(f"#ID3-EQUIV-TDTG:{(START_TIME + datetime.timedelta(seconds=index * 10)).isoformat()}\n")
+        muted = index % MUTED_EVERY < MUTED_RUN and index >= MUTED_EVERY
+        lines.append("#EXTINF:10.000,\n")
+        lines.append(f"{index}-unmuted{extension}\n" if muted else f"{index}{extension}\n")
+    lines.append("#EXT-X-ENDLIST")
+    return lines
+
+
+def measure(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark playlist transforms on synthetic playlists")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma separated segment counts")
+    parser.add_argument("--fmp4", action="store_true", help="Use .mp4 segments with an #EXT-X-MAP init segment")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per transform, best time is reported")
+    args = parser.parse_args()
+
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        lines = build_playlist(size, args.fmp4)
+        rewritten, segments = vod_recovery.rewrite_playlist_lines(lines, BASE_LINK)
+        written = "".join(rewritten).splitlines()
+        # Roughly what a partially expired VOD looks like, one segment in ten gone
+        valid = [segment for segment in segments if random.Random(segment).random() > 0.1]
+
+        transforms = [
+            ("rewrite_playlist_lines", lambda: vod_recovery.rewrite_playlist_lines(lines, BASE_LINK)),
+            ("rewrite (unmute)", lambda: vod_recovery.rewrite_playlist_lines(lines, BASE_LINK, unmute=True)),
+            # Only .ts lines are ever marked, timing it on fMP4 would measure a no-op
+            ("mark_invalid_segment_lines", None if args.fmp4 else lambda: vod_recovery.mark_invalid_segment_lines(written, valid)),
+            ("sum_extinf_durations", lambda: vod_recovery.sum_extinf_durations(lines)),
+            ("parse_m3u8_stream_date", lambda: vod_recovery.parse_m3u8_stream_date(lines)),
+            ("parse_playlist_timeline", lambda: vod_recovery.parse_playlist_timeline(lines, BASE_LINK)),
+        ]
+
+        print(f"\n{size} segments ({len(lines)} lines, {sum(map(len, lines)) / 1024:.0f} KB{', fMP4' if args.fmp4 else ''})")
+        for name, func in transforms:
+            if func is None:
+                print(f"  {name:<28} {'n/a':>9}")
+                continue
+            best, peak = measure(func, args.repeat)
+            print(f"  {name:<28} {best * 1000:9.2f} ms  {best / size * 1e6:7.2f} us/segment  peak {peak / 1024 / 1024:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
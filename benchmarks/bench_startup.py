@@ -0,0 +1,116 @@
+"""Guard the cold start cost of the real CLI entry paths.
+
+Usage:
+    python benchmarks/bench_startup.py [mode ...] [--repeat N] [--top N]
+        [--save-baseline FILE] [--baseline FILE] [--tolerance P]
+
+Every mode runs `python vod_recovery.py ...` in a fresh interpreter through
+an entry path that returns before any network request (help, the main menu
+answered with Exit, a --url that is rejected after dispatch), so lazy imports
+the CLI really triggers at startup are part of the time. The best wall time of
+--repeat runs is reported, plus one `-X importtime` run for the slowest
+imports and any heavy module the mode should never load.
+
+The per-mode budgets are only a rough guide and print a warning when exceeded,
+machines differ too much for fixed limits. Save a baseline on a known good
+commit and compare later runs against it instead; the script exits with 1 when
+a mode is more than --tolerance slower than its baseline or loads a module it
+must not.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+SCRIPT = os.path.join(REPO_DIR, "vod_recovery.py")
+
+HEAVY_MODULES = ["seleniumbase", "bs4", "tkinter", "tqdm", "ffmpeg_progress_yield", "ffmpeg_downloader", "packaging"]
+
+# mode: (CLI arguments, stdin, heavy modules the path may load, rough budget in ms)
+MODES = {
+    "help": (["--help"], "", [], 600),
+    "menu": ([], "8\n", [], 600),
+    "url": (["--url", "https://example.invalid/streams/1"], "", [], 600),
+}
+
+
+def run_cli(args, stdin, importtime=False):
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + [SCRIPT] + args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=REPO_DIR, input=stdin, capture_output=True, text=True, timeout=120)
+    return time.perf_counter() - start, result
+
+
+def parse_importtime(stderr):
+    timings, loaded = [], set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        loaded.add(name.strip().split(".")[0])
+        # Top level imports have no indentation, nested ones are already part of their parent
+        if not name.startswith("  "):
+            timings.append((int(cumulative), name.strip()))
+    return timings, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start of the CLI entry paths")
+    parser.add_argument("modes", nargs="*", help=f"Modes to check ({', '.join(MODES)}), all by default")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode, best time is reported")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top level imports to list per mode")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the measured times to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against times saved with --save-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline (0.25 is 25%%)")
+    args = parser.parse_args()
+
+    unknown = [mode for mode in args.modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode: {', '.join(unknown)}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    failed = False
+    measured = {}
+    for mode in args.modes or list(MODES):
+        cli_args, stdin, allowed, budget = MODES[mode]
+
+        best = min(run_cli(cli_args, stdin)[0] for _ in range(args.repeat)) * 1000
+        measured[mode] = round(best, 1)
+        _, result = run_cli(cli_args, stdin, importtime=True)
+        timings, loaded = parse_importtime(result.stderr)
+
+        unexpected = sorted(module for module in HEAVY_MODULES if module in loaded and module not in allowed)
+        notes = []
+        if unexpected:
+            failed = True
+            notes.append(f"FAIL unexpected imports: {', '.join(unexpected)}")
+        if mode in baseline:
+            change = best / baseline[mode] - 1
+            regressed = change > args.tolerance
+            failed = failed or regressed
+            notes.append(f"{'FAIL' if regressed else 'ok'} {change:+.0%} vs baseline {baseline[mode]:.0f} ms")
+        if best > budget:
+            notes.append(f"warning: over the rough {budget} ms budget")
+
+        print(f"{mode}: {best:.1f} ms  (python vod_recovery.py {' '.join(cli_args)}, exit {result.returncode})"
+              + ("".join(f"\n    {note}" for note in notes)))
+        for cumulative, name in sorted(timings, reverse=True)[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(measured, baseline_file, indent=4)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
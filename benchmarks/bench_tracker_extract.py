@@ -0,0 +1,88 @@
+"""Compare the regex tracker field extractor against a full BeautifulSoup parse.
+
+Usage:
+    python benchmarks/bench_tracker_extract.py [page.html ...] [--repeat N]
+
+Without page arguments every page saved in cache/tracker is used.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from bs4 import BeautifulSoup
+import vod_recovery
+
+
+FIELDS = [
+    ("div", "g-x-s-value", 0),
+    ("div", "stream-timestamp-dt", 0),
+    ("div", "text-xs font-bold", 3),
+    ("time", "ml-2 font-bold", 0),
+    ("span", "mx-2 font-bold", 0),
+    ("div", "MiddleSubHeaderItemValue", 6),
+    ("div", "MiddleSubHeaderItemValue", 7),
+]
+
+
+def soup_fields(source):
+    bs = BeautifulSoup(source, "html.parser")
+    values = []
+    for tag, class_name, index in FIELDS:
+        matches = bs.find_all(tag, {"class": class_name})
+        values.append(matches[index].text if len(matches) > index else None)
+    return values
+
+
+def fast_fields(source):
+    return [vod_recovery.find_tag_text(source, tag, class_name, index) for tag, class_name, index in FIELDS]
+
+
+def best_time(func, source, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tracker page field extraction")
+    parser.add_argument("pages", nargs="*", help="Saved tracker HTML pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page, best time is reported")
+    args = parser.parse_args()
+
+    pages = args.pages or sorted(glob.glob(os.path.join(vod_recovery.get_script_directory(), "cache", "tracker", "*.html")))
+    if not pages:
+        sys.exit("No pages given and cache/tracker is empty.")
+
+    total_soup = total_fast = 0.0
+    for page in pages:
+        with open(page, "r", encoding="utf-8", errors="ignore") as page_file:
+            source = page_file.read()
+
+        soup_time = best_time(soup_fields, source, args.repeat)
+        fast_time = best_time(fast_fields, source, args.repeat)
+        total_soup += soup_time
+        total_fast += fast_time
+
+        # A None from the fast path means it defers to BeautifulSoup, anything else must agree
+        mismatches = [
+            f"{tag}.{class_name}[{index}]"
+            for (tag, class_name, index), expected, actual in zip(FIELDS, soup_fields(source), fast_fields(source))
+            if actual is not None and actual != expected
+        ]
+        print(f"{os.path.basename(page)}: {len(source) / 1024:.0f} KB  "
+              f"bs4 {soup_time * 1000:.2f} ms  fast {fast_time * 1000:.2f} ms  "
+              f"x{soup_time / max(fast_time, 1e-9):.1f}"
+              + (f"  MISMATCH {', '.join(mismatches)}" if mismatches else ""))
+
+    print(f"\nTotal: bs4 {total_soup * 1000:.2f} ms  fast {total_fast * 1000:.2f} ms  x{total_soup / max(total_fast, 1e-9):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark the M3U8 URL search against a local mock CDN.
+
+Usage:
+    python benchmarks/bench_vod_search.py [--latency MS] [--jitter MS] [--loss P]
+        [--forbidden P] [--hit-offset S] [--hit-domain N] [--no-hit] [--repeat N]
+
+A separate process serves one path prefix per host in lib/domains.txt, so
+get_vod_urls sees the same number of domains and URLs as in production.
+Misses answer 403 (ratio --forbidden) or 404, --loss drops the connection,
+and one URL at --hit-offset seconds on --hit-domain returns a real playlist.
+Reports time to first hit, requests served, peak Python memory and CPU time
+of the search itself.
+"""
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import time
+import tracemalloc
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from aiohttp import web
+import vod_recovery
+
+STREAMER = "benchstreamer"
+VIDEO_ID = "40000000000"
+START_TIMESTAMP = "2024-01-01 12:00:00"
+PLAYLIST = "#EXTM3U\n#EXT-X-VERSION:3\n#EXT-X-TARGETDURATION:10\n#EXTINF:10.000,\n0.ts\n#EXT-X-ENDLIST\n"
+
+
+def planted_path(domain_index, offset, quality="chunked"):
+    epoch = int(vod_recovery.calculate_epoch_timestamp(START_TIMESTAMP, offset))
+    name = f"{STREAMER}_{VIDEO_ID}_{epoch}"
+    return f"/{domain_index}/{hashlib.sha1(name.encode('utf-8')).hexdigest()[:20]}_{name}/{quality}/index-dvr.m3u8"
+
+
+def run_mock_cdn(port, options, hit_path, ready):
+    stats = {"requests": 0, "hits": 0, "403": 0, "404": 0, "dropped": 0}
+    rng = random.Random(options["seed"])
+
+    async def handle(request):
+        if request.path == "/__stats":
+            return web.json_response(stats)
+        stats["requests"] += 1
+        await asyncio.sleep(max(0.0, options["latency"] + rng.uniform(-options["jitter"], options["jitter"])) / 1000)
+        if request.path == hit_path:
+            stats["hits"] += 1
+            return web.Response(text=PLAYLIST)
+        if rng.random() < options["loss"]:
+            stats["dropped"] += 1
+            request.transport.close()
+            return web.Response(status=499)
+        status = 403 if rng.random() < options["forbidden"] else 404
+        stats[str(status)] += 1
+        return web.Response(status=status)
+
+    app = web.Application()
+    app.router.add_route("GET", "/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+
+    async def serve():
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def read_stats(port):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/__stats", timeout=10) as response:
+        return json.load(response)
+
+
+def run_search(domains):
+    tracemalloc.start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    # The search prints a progress line per URL, which would dominate the timing on a terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        url = asyncio.run(vod_recovery.get_vod_urls(STREAMER, VIDEO_ID, START_TIMESTAMP, domains=domains))
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return url, wall, cpu, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark get_vod_urls against a local mock CDN")
+    parser.add_argument("--latency", type=float, default=20, help="Mean response latency in ms")
+    parser.add_argument("--jitter", type=float, default=10, help="Latency jitter in ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="Ratio of dropped connections")
+    parser.add_argument("--forbidden", type=float, default=0.5, help="Ratio of misses answered 403 instead of 404")
+    parser.add_argument("--hit-offset", type=int, default=45, help="Seconds from the start timestamp of the planted hit (-30 to 59)")
+    parser.add_argument("--hit-domain", type=int, default=-1, help="Domain index of the planted hit, -1 is the last")
+    parser.add_argument("--no-hit", action="store_true", help="Plant nothing and measure a full miss")
+    parser.add_argument("--repeat", type=int, default=1, help="Searches to run")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the mock CDN")
+    args = parser.parse_args()
+
+    hosts = [domain.strip() for domain in vod_recovery.read_text_file(os.path.join(vod_recovery.get_script_directory(), "lib", "domains.txt")) if domain.strip()]
+    port = free_port()
+    domains = [f"http://127.0.0.1:{port}/{index}/" for index in range(len(hosts))]
+    hit_domain = args.hit_domain % len(domains)
+    hit_path = None if args.no_hit else planted_path(hit_domain, args.hit_offset)
+
+    options = {"latency": args.latency, "jitter": args.jitter, "loss": args.loss, "forbidden": args.forbidden, "seed": args.seed}
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_mock_cdn, args=(port, options, hit_path, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(30):
+            sys.exit("Mock CDN did not start.")
+
+        print(f"{len(hosts)} mock hosts on port {port}, "
+              + (f"hit at {args.hit_offset:+d}s on host {hit_domain} ({hosts[hit_domain]})" if hit_path else "no hit planted"))
+        for run in range(1, args.repeat + 1):
+            before = read_stats(port)
+            url, wall, cpu, peak = run_search(domains)
+            after = read_stats(port)
+            served = {key: after[key] - before[key] for key in after}
+            found = "no hit" if not url else ("hit" if hit_path and url.endswith(hit_path) else "WRONG URL")
+            print(f"run {run}: {found} in {wall:.2f} s  cpu {cpu:.2f} s  peak {peak / 1024 / 1024:.1f} MB  "
+                  f"requests {served['requests']} (403 {served['403']}, 404 {served['404']}, dropped {served['dropped']})")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
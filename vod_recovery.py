@@ -1,33 +1,36 @@
 import argparse
 import ctypes
 import hashlib
+import heapq
 import json
 import csv
+import sqlite3
 import os
 import random
 import re
 import subprocess
-import tkinter as tk
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import atexit
+import uuid
+from contextlib import contextmanager, closing
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from http.cookiejar import DefaultCookiePolicy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
 import time
 from datetime import datetime, timedelta, timezone
-from tkinter import filedialog
 import shutil
 from urllib.parse import urlparse
 from pathlib import Path
 from unicodedata import normalize
+from html import unescape
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
-from seleniumbase import SB
 import requests
-from packaging import version
-import ffmpeg_downloader as ffdl
-from tqdm import tqdm
-from ffmpeg_progress_yield import FfmpegProgress
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-import importlib.metadata
 import tempfile
 import zipfile
 
@@ -39,9 +42,22 @@ logging.getLogger('aiohttp').setLevel(logging.CRITICAL)
 CURRENT_VERSION = "1.5.15"
 SUPPORTED_FORMATS = [".mp4", ".mkv", ".mov", ".avi", ".ts"]
 RESOLUTIONS = ["chunked", "2160p60", "2160p30", "2160p20", "1440p60", "1440p30", "1440p20", "1080p60", "1080p30", "1080p20", "720p60", "720p30", "720p20", "480p60", "480p30", "360p60", "360p30", "160p60", "160p30"]
+SEGMENT_DOWNLOAD_WORKERS = 16
+BULK_RECOVERY_WORKERS = 1
+API_STREAMS_PAGE_SIZE = 20
+VODVOD_REFRESH_MINUTES = 30
+CLIP_DOWNLOAD_WORKERS = 8
+CLIP_GQL_BATCH_SIZE = 35
+CLIP_GQL_CONCURRENCY = 4
+WATCH_GQL_BATCH_SIZE = 100
+WATCH_MAX_RETRIES = 5
+WATCH_RETRY_MAX_SECONDS = 1800
+SERVE_ADDRESS = "127.0.0.1:8765"
+JOB_WORKERS = 2
+SERVE_JOB_HISTORY = 500
 
 CLI_MODE = False
-CLI_DOWNLOAD_FROM_START = False
+NON_INTERACTIVE = False
 
 
 if sys.platform == 'win32':
@@ -54,6 +70,104 @@ if sys.platform == 'win32':
             print(f"Error setting event loop policy: {e}")
 
 
+class BrowserSession:
+    def __init__(self, headless):
+        from seleniumbase import SB
+
+        self.headless = headless
+        self.context = SB(uc=True, headless=headless)
+        self.sb = self.context.__enter__()
+        self.cdp_active = False
+
+    def open(self, url):
+        # CDP mode is activated once per browser, later pages just navigate the same tab
+        if self.cdp_active:
+            self.sb.cdp.open(url)
+        else:
+            self.sb.activate_cdp_mode(url)
+            self.cdp_active = True
+
+    def is_alive(self):
+        if not self.cdp_active:
+            return True
+        try:
+            self.sb.cdp.evaluate("1")
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        try:
+            self.context.__exit__(None, None, None)
+        except Exception:
+            pass
+
+
+class BrowserSessionPool:
+    # Keeps up to `size` browsers warm so a browser start is paid once per run instead of once per page
+    def __init__(self, size=1):
+        self.size = max(1, size)
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(self.size)
+        self.sessions = []
+        self.idle = []
+        atexit.register(self.close)
+
+    @contextmanager
+    def session(self, headless=True):
+        with self.slots:
+            browser = self.checkout(headless)
+            try:
+                yield browser
+            finally:
+                with self.lock:
+                    self.idle.append(browser)
+
+    def checkout(self, headless):
+        stale = []
+        with self.lock:
+            browser = next((session for session in self.idle if session.headless == headless), None)
+            if browser is not None:
+                self.idle.remove(browser)
+            else:
+                while len(self.sessions) >= self.size and self.idle:
+                    stale.append(self.idle.pop(0))
+                    self.sessions.remove(stale[-1])
+        for session in stale:
+            session.close()
+
+        if browser is not None:
+            if browser.is_alive():
+                return browser
+            browser.close()
+            with self.lock:
+                self.sessions.remove(browser)
+
+        browser = BrowserSession(headless)
+        with self.lock:
+            self.sessions.append(browser)
+        return browser
+
+    def close(self):
+        with self.lock:
+            sessions, self.sessions, self.idle = self.sessions, [], []
+        for session in sessions:
+            session.close()
+        selenium_cleanup()
+
+
+BROWSER_POOL = None
+BROWSER_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool():
+    global BROWSER_POOL
+    with BROWSER_POOL_LOCK:
+        if BROWSER_POOL is None:
+            BROWSER_POOL = BrowserSessionPool(get_browser_pool_size())
+        return BROWSER_POOL
+
+
 class ReturnToMain(Exception):
     pass
                 
@@ -61,68 +175,98 @@ def return_to_main_menu():
     raise ReturnToMain()
 
 
-def read_config_by_key(config_file, key):
-    script_dir = os.path.dirname(os.path.realpath(__file__))
-    config_path = os.path.join(script_dir, "config", f"{config_file}.json")
-    if not os.path.exists(config_path):
+CONFIG_CACHE = {}
+CONFIG_CACHE_LOCK = threading.Lock()
+CONFIG_RECHECK_SECONDS = 1.0
+SETTINGS_CACHE = {}
+
+
+def report_missing_config(script_dir, config_path):
+    try:
+        temp_dirs = set()
         try:
-            temp_dirs = set()
-            try:
-                temp_dirs.add(tempfile.gettempdir().lower())
-            except Exception:
-                pass
-            if os.name == "nt":
-                for env in ("TEMP", "TMP", "LOCALAPPDATA"):
-                    v = os.environ.get(env)
-                    if v:
-                        temp_dirs.add(v.lower())
-            in_temp = any(str(script_dir).lower().startswith(td) for td in temp_dirs if td)
-            looks_like_zip = ".zip" in str(script_dir).lower() or "\\zip\\" in str(script_dir).lower()
-
-            print("\n✖  Required file not found:")
-            print(f"   {config_path}")
-            if in_temp or looks_like_zip:
-                print("\nIt looks like you launched VodRecovery directly from a ZIP or a temporary folder.")
-                print("Please extract the entire VodRecovery folder first, then run vod_recovery.py (or the shortcut)")
-            else:
-                print("\nThe configuration folder is missing. Make sure you extracted the full release with the 'config' folder next to vod_recovery.py.")
-            try:
-                input("\nPress Enter to exit...")
-            except Exception:
-                pass
-            sys.exit(1)
-        except SystemExit:
-            raise
+            temp_dirs.add(tempfile.gettempdir().lower())
         except Exception:
-            return None
+            pass
+        if os.name == "nt":
+            for env in ("TEMP", "TMP", "LOCALAPPDATA"):
+                v = os.environ.get(env)
+                if v:
+                    temp_dirs.add(v.lower())
+        in_temp = any(str(script_dir).lower().startswith(td) for td in temp_dirs if td)
+        looks_like_zip = ".zip" in str(script_dir).lower() or "\\zip\\" in str(script_dir).lower()
+
+        print("\n✖  Required file not found:")
+        print(f"   {config_path}")
+        if in_temp or looks_like_zip:
+            print("\nIt looks like you launched VodRecovery directly from a ZIP or a temporary folder.")
+            print("Please extract the entire VodRecovery folder first, then run vod_recovery.py (or the shortcut)")
+        else:
+            print("\nThe configuration folder is missing. Make sure you extracted the full release with the 'config' folder next to vod_recovery.py.")
+        try:
+            input("\nPress Enter to exit...")
+        except Exception:
+            pass
+        sys.exit(1)
+    except SystemExit:
+        raise
+    except Exception:
+        return None
+
+
+def load_config(config_file):
+    # Parsed JSON is reused until the file's mtime or size changes; the stat itself runs at most once per CONFIG_RECHECK_SECONDS
+    now = time.monotonic()
+    with CONFIG_CACHE_LOCK:
+        cached = CONFIG_CACHE.get(config_file)
+        if cached and now - cached["checked_at"] < CONFIG_RECHECK_SECONDS:
+            return cached["config"]
+
+    script_dir = os.path.dirname(os.path.realpath(__file__))
+    config_path = os.path.join(script_dir, "config", f"{config_file}.json")
+    try:
+        config_stat = os.stat(config_path)
+    except FileNotFoundError:
+        report_missing_config(script_dir, config_path)
+        return None
+    signature = (config_stat.st_mtime_ns, config_stat.st_size)
+
+    with CONFIG_CACHE_LOCK:
+        cached = CONFIG_CACHE.get(config_file)
+        if cached and cached["signature"] == signature:
+            cached["checked_at"] = now
+            return cached["config"]
 
     with open(config_path, "r", encoding="utf-8") as input_config_file:
         config = json.load(input_config_file)
 
-    return config.get(key, None)
+    with CONFIG_CACHE_LOCK:
+        CONFIG_CACHE[config_file] = {"config": config, "signature": signature, "checked_at": now}
+    return config
 
 
-def get_default_video_format():
-    default_video_format = read_config_by_key("settings", "DEFAULT_VIDEO_FORMAT")
-    if default_video_format in SUPPORTED_FORMATS:
-        return default_video_format
-    return ".mp4"
+def invalidate_config_cache():
+    with CONFIG_CACHE_LOCK:
+        CONFIG_CACHE.clear()
 
 
-def get_ffmpeg_format(file_extension):
-    format_map = {
-        '.mp4': 'mp4',
-        '.mkv': 'matroska',
-        '.ts': 'mpegts',
-        '.mov': 'mov',
-        '.avi': 'avi'
-    }
-    return format_map.get(file_extension, 'mp4')
+def write_config_file(config_path, config):
+    # Written to a temporary file and swapped in, so a reader never sees a half written file cached as the new config
+    temp_path = f"{config_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as config_file:
+        json.dump(config, config_file, indent=4)
+    os.replace(temp_path, config_path)
+    invalidate_config_cache()
 
 
-def get_default_directory():
-    default_directory = read_config_by_key("settings", "DEFAULT_DIRECTORY")
+def read_config_by_key(config_file, key):
+    config = load_config(config_file)
+    if config is None:
+        return None
+    return config.get(key, None)
 
+
+def resolve_default_directory(default_directory):
     if not default_directory:
         default_directory = "~/Downloads/"
 
@@ -142,22 +286,64 @@ def get_default_directory():
     return default_directory
 
 
+class Settings:
+    # Typed view of settings.json, rebuilt only when the file changes
+    def __init__(self, config):
+        config = config or {}
+        self.directory_setting: str = config.get("DEFAULT_DIRECTORY") or "~/Downloads/"
+        self.video_format: str = config.get("DEFAULT_VIDEO_FORMAT") if config.get("DEFAULT_VIDEO_FORMAT") in SUPPORTED_FORMATS else ".mp4"
+        self.downloader: str = config.get("DEFAULT_DOWNLOADER") if config.get("DEFAULT_DOWNLOADER") in ["ffmpeg", "yt-dlp", "native"] else "ffmpeg"
+        self.use_progress_bar: bool = config.get("USE_PROGRESS_BAR") if config.get("USE_PROGRESS_BAR") is not None else True
+        custom_options = config.get("YT_DLP_OPTIONS")
+        self.yt_dlp_options: list = custom_options.split() if isinstance(custom_options, str) else []
+        self._default_directory = None
+
+    @property
+    def default_directory(self) -> str:
+        # Resolved and created once per settings load instead of on every path lookup
+        if self._default_directory is None:
+            self._default_directory = resolve_default_directory(self.directory_setting)
+        return self._default_directory
+
+
+def get_settings():
+    config = load_config("settings")
+    with CONFIG_CACHE_LOCK:
+        if SETTINGS_CACHE.get("config") is not config:
+            SETTINGS_CACHE["config"] = config
+            SETTINGS_CACHE["settings"] = Settings(config)
+        return SETTINGS_CACHE["settings"]
+
+
+def get_default_video_format():
+    return get_settings().video_format
+
+
+def get_ffmpeg_format(file_extension):
+    format_map = {
+        '.mp4': 'mp4',
+        '.mkv': 'matroska',
+        '.ts': 'mpegts',
+        '.mov': 'mov',
+        '.avi': 'avi'
+    }
+    return format_map.get(file_extension, 'mp4')
+
+
+def get_default_directory():
+    return get_settings().default_directory
+
+
 def get_default_downloader():
     try:
-        default_downloader = read_config_by_key("settings", "DEFAULT_DOWNLOADER")
-        if default_downloader in ["ffmpeg", "yt-dlp"]:
-            return default_downloader
-        return "ffmpeg"
+        return get_settings().downloader
     except Exception:
         return "ffmpeg"
     
 
 def get_yt_dlp_custom_options():
     try:
-        custom_options = read_config_by_key("settings", "YT_DLP_OPTIONS") 
-        if custom_options:
-            return custom_options.split()
-        return []
+        return list(get_settings().yt_dlp_options)
     except Exception:
         return []
 
@@ -334,7 +520,10 @@ def quote_filename(filename):
     return filename
 
 
-def get_yes_no_choice(prompt):
+def get_yes_no_choice(prompt, default=False):
+    if NON_INTERACTIVE:
+        print(f"\n{prompt} (Y/N): {'Y' if default else 'N'} (non-interactive)")
+        return default
     while True:
         choice = input(f"\n{prompt} (Y/N): ").strip().lower()
         if choice in ['y', 'yes']:
@@ -344,6 +533,54 @@ def get_yes_no_choice(prompt):
         print("Invalid input! Please enter 'Y' for Yes or 'N' for No.")
 
 
+def wait_for_enter(prompt="Press Enter to continue..."):
+    if not NON_INTERACTIVE:
+        input(prompt)
+
+
+def enable_non_interactive():
+    global NON_INTERACTIVE
+    NON_INTERACTIVE = True
+    # Any prompt without a default now fails its job instead of blocking a worker forever
+    sys.stdin = open(os.devnull, "r")
+    if not isinstance(sys.stdout, JobOutput):
+        sys.stdout = JobOutput(sys.stdout)
+
+
+def get_tool_stdin():
+    # ffmpeg and yt-dlp read keystrokes from an inherited terminal, unattended jobs must not hand it to them
+    return subprocess.DEVNULL if NON_INTERACTIVE else None
+
+
+JOB_CONTEXT = threading.local()
+
+
+class JobOutput:
+    # Prefixes every line printed from a job thread with its label, so concurrent jobs can be told apart
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        label = getattr(JOB_CONTEXT, "label", None)
+        if not label:
+            return self.stream.write(text)
+        with self.lock:
+            for piece in re.split(r"(\r|\n)", text):
+                if not piece:
+                    continue
+                if piece in ("\r", "\n"):
+                    JOB_CONTEXT.line_start = True
+                elif getattr(JOB_CONTEXT, "line_start", True):
+                    self.stream.write(f"[{label}] ")
+                    JOB_CONTEXT.line_start = False
+                self.stream.write(piece)
+        return len(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
 def get_websites_tracker_url():
     while True:
         tracker_url = input("Enter Twitchtracker/Streamscharts/Sullygnome url: ").strip()
@@ -432,7 +669,7 @@ def get_twitch_or_tracker_url():
 def get_latest_release_info(retries=3):
     for attempt in range(retries):
         try:
-            response = requests.get("https://api.github.com/repos/MacielG1/VodRecovery/releases/latest", timeout=30)
+            response = http_get("https://api.github.com/repos/MacielG1/VodRecovery/releases/latest", timeout=30)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -528,8 +765,7 @@ def merge_settings_defaults(new_settings_path, user_settings_path):
                 updated = True
 
         if updated:
-            with open(user_settings_path, "w", encoding="utf-8") as f_out:
-                json.dump(user_config, f_out, indent=4)
+            write_config_file(user_settings_path, user_config)
         return True
     except Exception:
         return False
@@ -547,7 +783,7 @@ def perform_self_update(latest_version_str=None):
         temp_directory = tempfile.mkdtemp(prefix="vodrecovery_update_")
         zip_destination_path = os.path.join(temp_directory, "update.zip")
 
-        with requests.get(zip_url, stream=True, timeout=60) as response:
+        with http_get(zip_url, stream=True, timeout=60) as response:
             response.raise_for_status()
             total_size = int(response.headers.get('content-length', 0))
             chunk_size = 1024 * 1024
@@ -614,7 +850,7 @@ def perform_self_update(latest_version_str=None):
 
 def fetch_vod_vod_streams(streamer_name):
     try:
-        response = requests.get(f"https://api.vodvod.top/channels/@{streamer_name}", headers=return_user_agent(), timeout=15)
+        response = http_get(f"https://api.vodvod.top/channels/@{streamer_name}", headers=return_user_agent(), timeout=15)
         
         if response.status_code != 200:
             return None
@@ -673,7 +909,7 @@ def get_datetime_from_vod_vod(url):
         else:
             return None
         
-        response = requests.get(f"https://api.vodvod.top/channels/@{streamer_name}", headers=return_user_agent(), timeout=15)
+        response = http_get(f"https://api.vodvod.top/channels/@{streamer_name}", headers=return_user_agent(), timeout=15)
         
         if response.status_code != 200:
             return None
@@ -750,146 +986,345 @@ def merge_api_and_vod_streams(api_streams, vod_streams):
 
     return result if result else None
 
-def fetch_recent_streams_api(streamer_name, max_streams=100):
-    try:        
-        query = """
-        query($login: String!, $first: Int!) {
-            user(login: $login) {
-                videos(first: $first) {
-                    edges {
-                        node {
-                            id
-                            title
-                            createdAt
-                            publishedAt
-                            lengthSeconds
-                            previewThumbnailURL
-                            animatedPreviewURL
-                        }
+KNOWN_VOD_PATHS = {}
+
+
+def extract_vod_path(streamer_name, *preview_urls):
+    # Preview URLs embed the VOD storage directory: {hash}_{streamer}_{broadcast_id}_{epoch}
+    for preview_url in preview_urls:
+        for part in (preview_url or "").split('/'):
+            if f'_{streamer_name}_' in part and split_vod_path(part, streamer_name)[0]:
+                return part
+    return None
+
+
+def split_vod_path(vod_path, streamer_name):
+    try:
+        broadcast_id, epoch = vod_path.split(f'_{streamer_name}_', 1)[1].split('_')[:2]
+        if broadcast_id.isdigit() and epoch.isdigit():
+            return broadcast_id, epoch
+    except (AttributeError, IndexError, ValueError):
+        pass
+    return None, None
+
+
+def remember_vod_path(video_id, vod_path):
+    if video_id and vod_path:
+        KNOWN_VOD_PATHS[str(video_id)] = vod_path
+
+
+def lookup_vod_path(streamer_name, video_id):
+    vod_path = KNOWN_VOD_PATHS.get(str(video_id))
+    if vod_path:
+        return vod_path
+    try:
+        with closing(open_stream_index()) as connection:
+            row = connection.execute(
+                "SELECT vod_path FROM streams WHERE streamer = ? AND stream_id = ? AND vod_path IS NOT NULL",
+                (streamer_name, str(video_id)),
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+
+def parse_stream_node(node, streamer_name):
+    created_at_iso = node.get("createdAt") or node.get("publishedAt")
+    if not created_at_iso:
+        return None
+
+    dt_utc = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
+    dt_utc_str = dt_utc.strftime("%Y-%m-%d %H:%M:%S")
+
+    # Convert to local time only for display purposes
+    dt_local = dt_utc.astimezone()
+    dt_local_str = dt_local.strftime("%Y-%m-%d %H:%M:%S")
+
+    length_seconds = node.get("lengthSeconds", 0)
+    duration_hours = length_seconds / 3600.0
+
+    vod_path = extract_vod_path(streamer_name, node.get("previewThumbnailURL", ""), node.get("animatedPreviewURL", ""))
+    extracted_vod_id, extracted_timestamp = split_vod_path(vod_path, streamer_name) if vod_path else (None, None)
+    if vod_path:
+        remember_vod_path(extracted_vod_id, vod_path)
+
+    final_timestamp = dt_utc_str
+    final_local_timestamp = dt_local_str
+    if extracted_timestamp:
+        try:
+            dt_from_url = datetime.fromtimestamp(int(extracted_timestamp), timezone.utc)
+            final_timestamp = dt_from_url.strftime("%Y-%m-%d %H:%M:%S")
+            dt_local_from_url = dt_from_url.astimezone()
+            final_local_timestamp = dt_local_from_url.strftime("%Y-%m-%d %H:%M:%S")
+        except Exception:
+            pass
+
+    return {
+        'dt_utc': final_timestamp,
+        'dt_local': final_local_timestamp,
+        'title': node.get("title", ""),
+        'duration': duration_hours,
+        'stream_id': extracted_vod_id or node.get("id", ""),
+        'vod_path': vod_path,
+        'created_at': dt_utc,
+    }
+
+
+def iter_recent_streams_api(streamer_name, page_size=20, max_age_days=60):
+    # Follows the videos cursor newest-first and stops at the first video past the horizon.
+    # The generator returns True when it reached the horizon or the last page, False when a request failed
+    query = """
+    query($login: String!, $first: Int!, $after: Cursor) {
+        user(login: $login) {
+            videos(first: $first, after: $after, sort: TIME) {
+                edges {
+                    cursor
+                    node {
+                        id
+                        title
+                        createdAt
+                        publishedAt
+                        lengthSeconds
+                        previewThumbnailURL
+                        animatedPreviewURL
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                }
             }
         }
-        """
-        
-        variables = {"login": streamer_name, "first": max_streams}
-        payload = {"query": query, "variables": variables}
-        
-        res = requests.post(
-            "https://gql.twitch.tv/gql",
-            json=payload,
-            headers={
-                "Client-ID": "ue6666qo983tsx6so1t0vnawi233wa",
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": "Mozilla/5.0",
-            },
-            timeout=30,
-        )
-        
-        
-        if res.status_code != 200:
-            return None
-            
-        data = res.json()
-            
-        if not data or "data" not in data or not data["data"]:
-            return None
-            
-        user_data = data["data"].get("user")
-        
-        if not user_data:
-            return None
-            
-        videos = user_data.get("videos", {}).get("edges", [])
-        streams = []
-        
-        for i, edge in enumerate(videos):
-            node = edge.get("node", {})
-            if not node:
-                continue
-                
+    }
+    """
+    horizon = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    cursor = None
+
+    while True:
+        try:
+            res = http_post(
+                "https://gql.twitch.tv/gql",
+                json={"query": query, "variables": {"login": streamer_name, "first": page_size, "after": cursor}},
+                headers={
+                    "Client-ID": "ue6666qo983tsx6so1t0vnawi233wa",
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "User-Agent": "Mozilla/5.0",
+                },
+                timeout=30,
+            )
+            if res.status_code != 200:
+                return False
+            data = res.json()
+            videos = ((data.get("data") or {}).get("user") or {}).get("videos") or {}
+        except Exception:
+            return False
+
+        edges = videos.get("edges") or []
+        for edge in edges:
+            cursor = edge.get("cursor") or cursor
+            node = edge.get("node") or {}
             try:
-                created_at_iso = node.get("createdAt") or node.get("publishedAt")
-                if not created_at_iso:
-                    continue
-                    
-                dt_utc = datetime.fromisoformat(created_at_iso.replace("Z", "+00:00"))
-                dt_utc_str = dt_utc.strftime("%Y-%m-%d %H:%M:%S")
+                stream = parse_stream_node(node, streamer_name)
+            except Exception:
+                continue
+            if stream is None:
+                continue
+            if stream.pop('created_at') < horizon:
+                return True
+            yield stream
 
-                # Convert to local time only for display purposes
-                dt_local = dt_utc.astimezone()
-                dt_local_str = dt_local.strftime("%Y-%m-%d %H:%M:%S")
+        if not edges or not (videos.get("pageInfo") or {}).get("hasNextPage"):
+            return True
 
-                length_seconds = node.get("lengthSeconds", 0)
-                duration_hours = length_seconds / 3600.0
 
-                current_date = datetime.now(dt_utc.tzinfo)
-                old_date = current_date - timedelta(days=60)
-                if dt_utc < old_date:
-                    continue
+def fetch_recent_streams_api(streamer_name, max_streams=100):
+    try:
+        return list(islice(iter_recent_streams_api(streamer_name), max_streams))
+    except Exception:
+        return None
 
-                preview_url = node.get("previewThumbnailURL", "")
-                animated_url = node.get("animatedPreviewURL", "")
-                extracted_vod_id = None
-                extracted_timestamp = None
-                
-                if preview_url:
-                    try:
-                        url_parts = preview_url.split('/')
-                        for part in url_parts:
-                            if f'_{streamer_name}_' in part:
-                                segments = part.split('_')
-                                if len(segments) >= 4:
-                                    extracted_vod_id = segments[2]
-                                    extracted_timestamp = segments[3]
-                                    break
-                    except Exception as e:
-                        pass
-                
-                if not extracted_vod_id and animated_url:
-                    try:
-                        url_parts = animated_url.split('/')
-                        for part in url_parts:
-                            if f'_{streamer_name}_' in part:
-                                segments = part.split('_')
-                                if len(segments) >= 4:
-                                    extracted_vod_id = segments[2]
-                                    extracted_timestamp = segments[3]
-                                    break
-                    except Exception as e:
-                        pass
-                
-                final_timestamp = dt_utc_str
-                final_local_timestamp = dt_local_str
-                if extracted_timestamp:
-                    try:
-                        dt_from_url = datetime.fromtimestamp(int(extracted_timestamp), timezone.utc)
-                        final_timestamp = dt_from_url.strftime("%Y-%m-%d %H:%M:%S")
-                        dt_local_from_url = dt_from_url.astimezone()
-                        final_local_timestamp = dt_local_from_url.strftime("%Y-%m-%d %H:%M:%S")
-                    except Exception as e:
-                        pass
 
-                stream = {
-                    'dt_utc': final_timestamp,
-                    'dt_local': final_local_timestamp,
-                    'title': node.get("title", ""),
-                    'duration': duration_hours,
-                    'stream_id': extracted_vod_id or node.get("id", ""),
-                }
-                streams.append(stream)
-                
-            except Exception as e:
-                pass
-                continue
-        
-        return streams
-        
-    except Exception as e:
+STREAM_INDEX_READY = set()
+
+
+def open_stream_index():
+    cache_dir = os.path.join(get_script_directory(), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, "streams.db")
+    connection = sqlite3.connect(index_path, timeout=30, check_same_thread=False)
+    # The schema is checked once per process, not on every connection
+    if index_path in STREAM_INDEX_READY:
+        return connection
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS streams (
+            streamer TEXT NOT NULL,
+            source TEXT NOT NULL,
+            stream_id TEXT NOT NULL,
+            dt_utc TEXT,
+            title TEXT,
+            duration REAL,
+            vod_path TEXT,
+            PRIMARY KEY (streamer, source, stream_id)
+        )
+    """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS refresh_state (
+            streamer TEXT NOT NULL,
+            source TEXT NOT NULL,
+            refreshed_at REAL NOT NULL,
+            PRIMARY KEY (streamer, source)
+        )
+    """)
+    connection.commit()
+    STREAM_INDEX_READY.add(index_path)
+    return connection
+
+
+@contextmanager
+def use_stream_index(connection=None):
+    # Reuses the caller's connection when it holds one, otherwise opens a short lived one
+    if connection is not None:
+        yield connection
+        return
+    with closing(open_stream_index()) as connection:
+        yield connection
+
+
+def save_indexed_streams(streamer_name, source, streams, connection=None):
+    rows = [
+        (streamer_name, source, str(stream['stream_id']), stream.get('dt_utc'), stream.get('title'), stream.get('duration'), stream.get('vod_path'))
+        for stream in streams
+        if stream.get('stream_id')
+    ]
+    if not rows:
+        return
+    try:
+        with use_stream_index(connection) as connection, connection:
+            connection.executemany("""
+                INSERT INTO streams (streamer, source, stream_id, dt_utc, title, duration, vod_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (streamer, source, stream_id) DO UPDATE SET
+                    dt_utc = excluded.dt_utc,
+                    title = excluded.title,
+                    duration = excluded.duration,
+                    vod_path = COALESCE(excluded.vod_path, streams.vod_path)
+            """, rows)
+    except sqlite3.Error:
+        pass
+
+
+def load_indexed_streams(streamer_name, source, max_age_days=60, connection=None):
+    horizon = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with use_stream_index(connection) as connection:
+            rows = connection.execute(
+                "SELECT stream_id, dt_utc, title, duration, vod_path FROM streams "
+                "WHERE streamer = ? AND source = ? AND dt_utc >= ? ORDER BY dt_utc DESC",
+                (streamer_name, source, horizon),
+            ).fetchall()
+    except sqlite3.Error:
+        return []
+
+    streams = []
+    for stream_id, dt_utc, title, duration, vod_path in rows:
+        try:
+            dt_local = datetime.strptime(dt_utc, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+        except (TypeError, ValueError):
+            dt_local = dt_utc
+        streams.append({
+            'dt_utc': dt_utc,
+            'dt_local': dt_local,
+            'title': title,
+            'duration': duration,
+            'stream_id': stream_id,
+            'vod_path': vod_path,
+        })
+    return streams
+
+
+def get_index_refreshed_at(streamer_name, source, connection=None):
+    try:
+        with use_stream_index(connection) as connection:
+            row = connection.execute("SELECT refreshed_at FROM refresh_state WHERE streamer = ? AND source = ?", (streamer_name, source)).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
         return None
 
 
+def set_index_refreshed_at(streamer_name, source, connection=None):
+    try:
+        with use_stream_index(connection) as connection, connection:
+            connection.execute("INSERT OR REPLACE INTO refresh_state (streamer, source, refreshed_at) VALUES (?, ?, ?)", (streamer_name, source, time.time()))
+    except sqlite3.Error:
+        pass
+
+
+def clear_index_refreshed_at(streamer_name, source, connection=None):
+    try:
+        with use_stream_index(connection) as connection, connection:
+            connection.execute("DELETE FROM refresh_state WHERE streamer = ? AND source = ?", (streamer_name, source))
+    except sqlite3.Error:
+        pass
+
+
+def iter_new_streams_api(streamer_name, page_size=API_STREAMS_PAGE_SIZE):
+    # Indexes streams newest-first. Stopping at the first already indexed stream is only safe once a run has
+    # paged all the way to the horizon ("api_complete"); until then older pages are back-filled on every run
+    # One connection for the whole run, streams are written a page at a time in a single transaction
+    try:
+        connection = open_stream_index()
+    except sqlite3.Error:
+        connection = None
+    known_ids = {stream['stream_id'] for stream in load_indexed_streams(streamer_name, "api", connection=connection)}
+    index_complete = get_index_refreshed_at(streamer_name, "api_complete", connection) is not None
+    stream_pages = iter_recent_streams_api(streamer_name, page_size=page_size)
+    caught_up = False
+    pending = []
+    try:
+        while True:
+            try:
+                stream = next(stream_pages)
+            except StopIteration as finished:
+                caught_up = bool(finished.value)
+                break
+            pending.append(stream)
+            if len(pending) >= page_size:
+                save_indexed_streams(streamer_name, "api", pending, connection)
+                pending = []
+            yield stream
+            if index_complete and str(stream['stream_id']) in known_ids:
+                caught_up = True
+                break
+    finally:
+        save_indexed_streams(streamer_name, "api", pending, connection)
+        # A failed or abandoned run may leave new streams without the older ones they connect to
+        if caught_up:
+            set_index_refreshed_at(streamer_name, "api_complete", connection)
+        elif index_complete:
+            clear_index_refreshed_at(streamer_name, "api_complete", connection)
+        if connection is not None:
+            connection.close()
+
+
+def refresh_vodvod_index(streamer_name):
+    # vodvod only serves a full channel dump, so it is re-downloaded at most every VODVOD_REFRESH_MINUTES
+    try:
+        connection = open_stream_index()
+    except sqlite3.Error:
+        connection = None
+    try:
+        refreshed_at = get_index_refreshed_at(streamer_name, "vodvod", connection)
+        if refreshed_at is None or time.time() - refreshed_at > VODVOD_REFRESH_MINUTES * 60:
+            vod_streams = fetch_vod_vod_streams(streamer_name)
+            if vod_streams:
+                save_indexed_streams(streamer_name, "vodvod", vod_streams, connection)
+                set_index_refreshed_at(streamer_name, "vodvod", connection)
+        return load_indexed_streams(streamer_name, "vodvod", connection=connection)
+    finally:
+        if connection is not None:
+            connection.close()
+
+
 def get_latest_streams(streamer_name=None, skip_gql=False):
     if not streamer_name:   
         streamer_name = input("\nEnter streamer name: ").strip().lower()
@@ -899,6 +1334,8 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
     
     print("\nSearching for streams...")
     streams = None
+    api_streams, vod_streams = [], None
+    pending_streams = None
     if not skip_gql:
         def fetch_with_retry(func, *args):
             for _ in range(3):
@@ -911,17 +1348,34 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
                 time.sleep(1)
             return None
 
+        def fetch_first_api_page():
+            # One full API page always covers the first displayed page, even after merging vodvod rows
+            for _ in range(3):
+                stream_pages = iter_new_streams_api(streamer_name)
+                first_page = list(islice(stream_pages, API_STREAMS_PAGE_SIZE))
+                if first_page:
+                    return first_page, stream_pages
+                time.sleep(1)
+            return [], None
+
         with ThreadPoolExecutor(max_workers=2) as executor:
-            future_api = executor.submit(fetch_with_retry, fetch_recent_streams_api, streamer_name)
-            future_vod = executor.submit(fetch_with_retry, fetch_vod_vod_streams, streamer_name)
-            
-            api_streams = future_api.result()
+            future_api = executor.submit(fetch_first_api_page)
+            future_vod = executor.submit(fetch_with_retry, refresh_vodvod_index, streamer_name)
+
+            api_streams, stream_pages = future_api.result()
             vod_streams = future_vod.result()
 
+        if stream_pages is not None and len(api_streams) == API_STREAMS_PAGE_SIZE:
+            background = ThreadPoolExecutor(max_workers=1)
+            pending_streams = background.submit(list, stream_pages)
+            background.shutdown(wait=False)
+        else:
+            api_streams = load_indexed_streams(streamer_name, "api")
+
         streams = merge_api_and_vod_streams(api_streams, vod_streams)
 
     if streams:
-        print(f"✓ Found {len(streams)} streams")
+        print(f"✓ Found {len(streams)}{'+' if pending_streams else ''} streams")
     else:
         
         max_retries = 5
@@ -956,6 +1410,23 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
     rows_per_page = 10
     total_rows = len(streams)
     total_pages = (total_rows + rows_per_page - 1) // rows_per_page
+
+    def has_next_page():
+        return current_page < total_pages or pending_streams is not None
+
+    def finish_loading_streams():
+        nonlocal streams, total_rows, total_pages, pending_streams
+        if pending_streams is None:
+            return
+        print("\nLoading older streams...")
+        try:
+            pending_streams.result()
+        except Exception:
+            pass
+        pending_streams = None
+        streams = merge_api_and_vod_streams(load_indexed_streams(streamer_name, "api"), vod_streams) or streams
+        total_rows = len(streams)
+        total_pages = (total_rows + rows_per_page - 1) // rows_per_page
     
     def display_streams(page_num):
         start_idx = (page_num - 1) * 10
@@ -1009,7 +1480,7 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
         print("\nOptions:")
         print("1. Recover specific stream")
         print("2. Recover all streams")
-        if current_page < total_pages:
+        if has_next_page():
             print("3. Show next page")
             if not skip_gql:
                 print("4. Use Browser Search")
@@ -1090,9 +1561,13 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
                     print(f"\n✖  Could not recover VOD {video_id}!")
             break
         elif choice == "3":
-            if current_page < total_pages:
-                current_page += 1
-                stream_info, valid_streams = display_streams(current_page)
+            if has_next_page():
+                finish_loading_streams()
+                if current_page < total_pages:
+                    current_page += 1
+                    stream_info, valid_streams = display_streams(current_page)
+                else:
+                    print("\nNo older streams found.")
             else:
                 if not skip_gql:
                     get_latest_streams(streamer_name=streamer_name, skip_gql=True)
@@ -1100,7 +1575,7 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
                 else:
                     break
         elif choice == "4":
-            if current_page < total_pages:
+            if has_next_page():
                 if not skip_gql:
                     get_latest_streams(streamer_name=streamer_name, skip_gql=True)
                     return
@@ -1115,6 +1590,8 @@ def get_latest_streams(streamer_name=None, skip_gql=False):
 
 
 def check_for_updates():
+    from packaging import version
+
     latest_tag = get_latest_version()
     normalized_tag = latest_tag.lstrip('vV') if latest_tag else None
     try:
@@ -1146,14 +1623,14 @@ def check_for_updates():
                             except Exception:
                                 pass
                             sys.exit(0)
-                input("\nPress Enter to continue...")
+                wait_for_enter("\nPress Enter to continue...")
                 return_to_main_menu()
             else:
-                input("\nPress Enter to continue...")
+                wait_for_enter("\nPress Enter to continue...")
                 return
         else:
             print(f"\n\033[92m\u2713 Vod Recovery is up to date ({CURRENT_VERSION}).\033[0m")
-            input("\nPress Enter to continue...")
+            wait_for_enter("\nPress Enter to continue...")
             return
     else:
         print("\n✖  Could not check for updates!")
@@ -1255,7 +1732,7 @@ def write_m3u8_to_file(m3u8_link, destination_path, max_retries=5):
     attempt = 0
     while attempt < max_retries:
         try:
-            response = requests.get(m3u8_link, timeout=30)
+            response = http_get(m3u8_link, retry=False, timeout=30)
             if response.status_code == 200:
                 with open(destination_path, "w", encoding="utf-8") as m3u8_file:
                     m3u8_file.write(response.text)
@@ -1295,19 +1772,88 @@ def ensure_absolute_uri(uri: str, base_link: str) -> str:
     return f"{base_link}{uri}"
 
 
-def read_csv_file(csv_file_path):
-    with open(csv_file_path, "r", encoding="utf-8") as csv_file:
-        return [row for row in csv.reader(csv_file)]
+def iter_csv_rows(csv_file_path):
+    # Streams the data rows after the header, so large exports never sit in memory as a whole
+    with open(csv_file_path, "r", encoding="utf-8", newline="") as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader, None)
+        for row in reader:
+            if row:
+                yield row
+
+
+def map_bounded(func, items, workers):
+    # Yields (item, result) as work finishes, pulling new items only while fewer than 2 * workers are in flight
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for item in items:
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        for future in as_completed(pending):
+            yield pending[future], future.result()
+
+
+def map_bounded_ordered(func, items, workers):
+    # Same as map_bounded, but results that finish early are held back so they come out in input order
+    buffered, next_index = {}, 0
+    for (index, item), result in map_bounded(lambda pair: func(pair[1]), enumerate(items), workers):
+        buffered[index] = (item, result)
+        while next_index in buffered:
+            yield buffered.pop(next_index)
+            next_index += 1
 
 
 def get_use_progress_bar():
     try:
-        use_progress_bar = read_config_by_key("settings", "USE_PROGRESS_BAR")
-        return use_progress_bar if use_progress_bar is not None else True
+        return get_settings().use_progress_bar
     except Exception:
         return True
         
 
+def get_tracker_cache_hours():
+    try:
+        cache_hours = read_config_by_key("settings", "TRACKER_CACHE_HOURS")
+        return float(cache_hours) if cache_hours is not None else 12.0
+    except Exception:
+        return 12.0
+
+
+def get_browser_pool_size():
+    try:
+        pool_size = read_config_by_key("settings", "BROWSER_POOL_SIZE")
+        return max(1, int(pool_size)) if pool_size is not None else 1
+    except Exception:
+        return 1
+
+
+def get_watch_poll_seconds():
+    try:
+        poll_seconds = read_config_by_key("settings", "WATCH_POLL_SECONDS")
+        return max(10, int(poll_seconds)) if poll_seconds is not None else 60
+    except Exception:
+        return 60
+
+
+def get_bulk_recovery_workers():
+    # Every parallel VOD search is another full brute force of the CDNs, so one at a time unless asked otherwise
+    try:
+        workers = read_config_by_key("settings", "BULK_RECOVERY_WORKERS")
+        return max(1, int(workers)) if workers is not None else BULK_RECOVERY_WORKERS
+    except Exception:
+        return BULK_RECOVERY_WORKERS
+
+
+def get_max_concurrent_recordings():
+    try:
+        max_recordings = read_config_by_key("settings", "MAX_CONCURRENT_RECORDINGS")
+        return max(1, int(max_recordings)) if max_recordings is not None else 3
+    except Exception:
+        return 3
+
+
 def get_current_version():
     current_version = read_config_by_key("settings", "CURRENT_VERSION")
     if current_version:
@@ -1330,13 +1876,63 @@ def get_script_directory():
     return os.path.dirname(os.path.realpath(__file__))
 
 
+USER_AGENTS = []
+HTTP_SESSIONS = {}
+HTTP_SESSION_LOCK = threading.Lock()
+
+
 def return_user_agent():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    user_agents = read_text_file(os.path.join(script_dir, "lib", "user_agents.txt"))
-    header = {"user-agent": random.choice(user_agents)}
+    if not USER_AGENTS:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        USER_AGENTS.extend(agent for agent in read_text_file(os.path.join(script_dir, "lib", "user_agents.txt")) if agent)
+    header = {"user-agent": random.choice(USER_AGENTS)}
     return header
 
 
+def get_http_session(retry=True):
+    # One keep-alive pool per host shared by every synchronous request. Callers with their own retry loop
+    # use the session without adapter retries so attempts don't multiply
+    with HTTP_SESSION_LOCK:
+        if retry not in HTTP_SESSIONS:
+            max_retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                # 403/503 are left alone so tracker challenges fall through to the browser without delay
+                status_forcelist=(429, 500, 502, 504),
+                allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ) if retry else 0
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=max_retries)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            # The session is shared by every host and thread, so response cookies are never kept,
+            # a caller that needs cookies (e.g. tracker clearance) passes its own on each request
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            HTTP_SESSIONS[retry] = session
+        return HTTP_SESSIONS[retry]
+
+
+def http_request(method, url, retry=True, **kwargs):
+    kwargs.setdefault("timeout", 30)
+    return get_http_session(retry).request(method, url, **kwargs)
+
+
+def http_get(url, **kwargs):
+    return http_request("GET", url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    return http_request("POST", url, **kwargs)
+
+
+def http_head(url, **kwargs):
+    kwargs.setdefault("allow_redirects", False)
+    return http_request("HEAD", url, **kwargs)
+
+
 def calculate_epoch_timestamp(timestamp, seconds):
     try:
         epoch_timestamp = ((datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S") + timedelta(seconds=seconds)) - datetime(1970, 1, 1)).total_seconds()
@@ -1354,7 +1950,7 @@ def calculate_days_since_broadcast(start_timestamp):
 
 def is_video_muted(m3u8_link):
     try:
-        response = requests.get(m3u8_link, timeout=20)
+        response = http_get(m3u8_link, timeout=20)
         if response.status_code == 200:
             return bool("unmuted" in response.text)
         elif response.status_code in (403, 404, 410):
@@ -1416,7 +2012,7 @@ def parse_streamscharts_url(streamscharts_url):
         return streamer_name, video_id
     except IndexError:
         print("\033[91m \n✖  Invalid Streamscharts URL! Please try again:\n \033[0m")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return_to_main_menu()
 
 
@@ -1427,7 +2023,7 @@ def parse_twitchtracker_url(twitchtracker_url):
         return streamer_name, video_id
     except IndexError:
         print("\033[91m \n✖  Invalid Twitchtracker URL! Please try again:\n \033[0m")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return_to_main_menu()
 
 
@@ -1438,7 +2034,7 @@ def parse_sullygnome_url(sullygnome_url):
         return streamer_name, video_id
     except IndexError:
         print("\033[91m \n✖  Invalid SullyGnome URL! Please try again:\n \033[0m")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return_to_main_menu()
 
 
@@ -1463,8 +2059,7 @@ def set_default_video_format():
 
             config_data["DEFAULT_VIDEO_FORMAT"] = selected_format
 
-            with open(config_file_path, "w", encoding="utf-8") as config_file:
-                json.dump(config_data, config_file, indent=4)
+            write_config_file(config_file_path, config_data)
 
             print(f"\n\033[92m\u2713  Default video format set to: {selected_format.lstrip('.')}\033[0m")
 
@@ -1476,6 +2071,9 @@ def set_default_video_format():
 
 
 def set_default_directory():
+    import tkinter as tk
+    from tkinter import filedialog
+
     try:
         print("\nSelect the default directory")
         window = tk.Tk()
@@ -1496,8 +2094,7 @@ def set_default_directory():
                     config_data = json.load(config_file)
 
                 config_data["DEFAULT_DIRECTORY"] = file_path
-                with open(config_file_path, "w", encoding="utf-8") as config_file:
-                    json.dump(config_data, config_file, indent=4)
+                write_config_file(config_file_path, config_data)
 
                 print(f"\n\033[92m\u2713  Default directory set to: {file_path}\033[0m")
 
@@ -1533,8 +2130,7 @@ def set_default_directory():
                     config_data = json.load(config_file)
 
                 config_data["DEFAULT_DIRECTORY"] = file_path
-                with open(config_file_path, "w", encoding="utf-8") as config_file:
-                    json.dump(config_data, config_file, indent=4)
+                write_config_file(config_file_path, config_data)
 
                 print(f"\n\033[92m\u2713  Default directory set to: {file_path}\033[0m")
                 break
@@ -1545,9 +2141,9 @@ def set_default_directory():
 
 
 def set_default_downloader():
-    # Choose between ffmpeg and yt-dlp
+    # Choose between ffmpeg, yt-dlp and the built-in segment downloader
     print("\nSelect the default downloader")
-    DOWNLOADERS = ["ffmpeg", "yt-dlp"]
+    DOWNLOADERS = ["ffmpeg", "yt-dlp", "native"]
     for i, downloader_option in enumerate(DOWNLOADERS, start=1):
         print(f"{i}) {downloader_option.lstrip('.')}")
 
@@ -1564,8 +2160,7 @@ def set_default_downloader():
                 config_data = json.load(config_file)
 
             config_data["DEFAULT_DOWNLOADER"] = selected_downloader
-            with open(config_file_path, "w", encoding="utf-8") as config_file:
-                json.dump(config_data, config_file, indent=4)
+            write_config_file(config_file_path, config_data)
 
             print(f"\n\033[92m\u2713  Default downloader set to: {selected_downloader}\033[0m")
 
@@ -1577,6 +2172,9 @@ def set_default_downloader():
 
 
 def get_m3u8_file_dialog():
+    import tkinter as tk
+    from tkinter import filedialog
+
     try:
         window = tk.Tk()
         window.wm_attributes("-topmost", 1)
@@ -1820,17 +2418,90 @@ async def fetch_status(session, url, retries=5, timeout=30):
     return None
 
 
-async def get_vod_urls(streamer_name, video_id, start_timestamp):
-    script_dir = get_script_directory()
-    domains = read_text_file(os.path.join(script_dir, "lib", "domains.txt"))
+def get_domain_hits_path():
+    cache_dir = os.path.join(get_script_directory(), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "domain_hits.json")
+
+
+def load_domain_hits():
+    try:
+        with open(get_domain_hits_path(), "r", encoding="utf-8") as hits_file:
+            return json.load(hits_file)
+    except Exception:
+        return {}
+
+
+DOMAIN_HITS_LOCK = threading.Lock()
+
+
+def record_domain_hit(m3u8_url):
+    # Bulk recovery finds URLs from several threads, the read-modify-write must not interleave
+    domain = f"{urlparse(m3u8_url).scheme}://{urlparse(m3u8_url).netloc}/"
+    with DOMAIN_HITS_LOCK:
+        hits = load_domain_hits()
+        hits[domain] = hits.get(domain, 0) + 1
+        try:
+            hits_path = get_domain_hits_path()
+            with open(hits_path + ".part", "w", encoding="utf-8") as hits_file:
+                json.dump(hits, hits_file, indent=4)
+            os.replace(hits_path + ".part", hits_path)
+        except Exception:
+            pass
+
+
+def get_ranked_domains():
+    # domains.txt order breaks ties, so the list is unchanged until something has been found
+    domains = [domain.strip() for domain in read_text_file(os.path.join(get_script_directory(), "lib", "domains.txt")) if domain.strip()]
+    hits = load_domain_hits()
+    return sorted(domains, key=lambda domain: -hits.get(domain, 0))
+
+
+async def find_vod_by_path(vod_path, domains, qualities=("chunked", "1080p60"), wave_size=4):
+    # Tries the exact storage path on the best-ranked domains first, a few at a time
+    candidate_urls = [f"{domain}{vod_path}/{quality}/index-dvr.m3u8" for domain in domains for quality in qualities]
+    async with aiohttp.ClientSession() as session:
+        for start in range(0, len(candidate_urls), wave_size):
+            results = await asyncio.gather(*(fetch_status(session, url, retries=1, timeout=10) for url in candidate_urls[start:start + wave_size]))
+            for url in results:
+                if url:
+                    return url
+    return None
+
+
+async def get_vod_urls(streamer_name, video_id, start_timestamp, domains=None, quiet=False):
+    # An explicit domain list (e.g. the mock CDN benchmark) skips the ranking and leaves the hit counts alone,
+    # quiet leaves all progress output to the caller, e.g. bulk recovery running several searches at once
+    record_hits = domains is None
+    if domains is None:
+        domains = get_ranked_domains()
     qualities = ["chunked", "1080p60"]
 
-    print("\nSearching for M3U8 URL...")
+    vod_path = lookup_vod_path(streamer_name, video_id)
+    if vod_path:
+        if not quiet:
+            print("\nTrying the known VOD path...")
+        try:
+            successful_url = await find_vod_by_path(vod_path, domains, qualities)
+        except Exception:
+            successful_url = None
+        if successful_url:
+            if not quiet:
+                print(f"\033[92m✓ Found URL: {successful_url}\033[0m\n")
+            if record_hits:
+                record_domain_hit(successful_url)
+            return successful_url
+
+    if not start_timestamp:
+        return None
+
+    if not quiet:
+        print("\nSearching for M3U8 URL...")
 
     m3u8_link_list = [
         f"{domain.strip()}{str(hashlib.sha1(f'{streamer_name}_{video_id}_{int(calculate_epoch_timestamp(start_timestamp, seconds))}'.encode('utf-8')).hexdigest())[:20]}_{streamer_name}_{video_id}_{int(calculate_epoch_timestamp(start_timestamp, seconds))}/{quality}/index-dvr.m3u8"
         for seconds in range(-30, 60)
-        for domain in domains if domain.strip()
+        for domain in domains
         for quality in qualities
     ]
 
@@ -1845,12 +2516,14 @@ async def get_vod_urls(streamer_name, video_id, start_timestamp):
             for index, task in enumerate(asyncio.as_completed(task_objects), 1):
                 try:
                     url = await task
-                    print(f"\rSearching {index}/{len(m3u8_link_list)} URLs", end="", flush=True)
-                    progress_printed = True
+                    if not quiet:
+                        print(f"\rSearching {index}/{len(m3u8_link_list)} URLs", end="", flush=True)
+                        progress_printed = True
                     if url:
                         successful_url = url
-                        print("\n" if progress_printed else "\n\n")
-                        print(f"\033[92m✓ Found URL: {successful_url}\033[0m\n")
+                        if not quiet:
+                            print("\n" if progress_printed else "\n\n")
+                            print(f"\033[92m✓ Found URL: {successful_url}\033[0m\n")
                         for task_obj in task_objects:
                             try:
                                 task_obj.cancel()
@@ -1863,9 +2536,12 @@ async def get_vod_urls(streamer_name, video_id, start_timestamp):
                     continue
 
     except Exception as e:
-        print(f"\n\033[91m✖ Error during URL search: {str(e)}\033[0m")
+        if not quiet:
+            print(f"\n\033[91m✖ Error during URL search: {str(e)}\033[0m")
         return None
 
+    if successful_url and record_hits:
+        record_domain_hit(successful_url)
     return successful_url
 
 
@@ -1951,12 +2627,12 @@ def return_supported_qualities(m3u8_link):
     def check_quality(resolution):
         url = m3u8_link.replace(f"/{found_quality}/", f"/{resolution}/")
         try:
-            response = requests.get(url, timeout=20)
+            response = http_get(url, timeout=20)
             if response.status_code == 200:
                 return resolution
             elif response.status_code in (403, 404, 410):
                 segment_url = url.replace("index-dvr.m3u8", "0.ts")
-                seg_response = requests.head(segment_url, timeout=10)
+                seg_response = http_head(segment_url, timeout=10)
                 if seg_response.status_code == 200:
                     return resolution
         except Exception as e:
@@ -2052,6 +2728,9 @@ def parse_website_duration(duration_string):
 
 
 def check_seleniumbase_version():
+    import importlib.metadata
+    from packaging import version
+
     try:
         requirements_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib", "requirements.txt")
         required_version = None
@@ -2124,6 +2803,57 @@ def relaunch_as_admin():
         subprocess.run(["sudo", sys.executable] + sys.argv)
 
 
+TRACKER_READY_SELECTORS = {
+    "twitchtracker.com": [".stream-timestamp-dt", ".g-x-s-value", "#streams tbody tr"],
+    "streamscharts.com": ["time.ml-2.font-bold", "div.text-xs.font-bold"],
+    "sullygnome.com": [".MiddleSubHeaderItemValue"],
+}
+CLIP_THUMBNAIL_SELECTORS = [
+    'img[src*="twitch-clips-thumbnails-prod"]',
+    '[data-src*="twitch-clips-thumbnails-prod"]',
+    '[style*="twitch-clips-thumbnails-prod"]',
+]
+
+
+def get_ready_selectors(url):
+    hostname = urlparse(url).hostname or ""
+    for domain, selectors in TRACKER_READY_SELECTORS.items():
+        if hostname.endswith(domain):
+            return selectors
+    return []
+
+
+CHALLENGE_PAGE_MARKERS = ["security verification", "<title>Just a moment", "cf_chl_opt", "cf-chl-"]
+
+
+def is_challenge_page(url, source):
+    # A Cloudflare challenge can still be on screen after the wait, it must never pass as the real page
+    markers = CHALLENGE_PAGE_MARKERS + [f"Waiting for {urlparse(url).hostname} to respond..."]
+    return not source or any(marker in source for marker in markers)
+
+
+def wait_for_page_ready(sb, selectors, timeout=15, interval=0.25, on_poll=None):
+    # Polls the DOM for a marker of the data we need instead of sleeping a fixed amount,
+    # a page still showing a challenge is never ready even if a selector already matches
+    if selectors:
+        script = f"{json.dumps(selectors)}.some(function(s) {{ return document.querySelector(s) !== null; }})"
+    else:
+        script = "document.readyState === 'complete'"
+    script = f"({script}) && !{json.dumps(CHALLENGE_PAGE_MARKERS)}.some(function(m) {{ return document.documentElement.outerHTML.indexOf(m) !== -1; }})"
+    deadline = time.time() + timeout
+    while True:
+        try:
+            if sb.cdp.evaluate(script):
+                return True
+        except Exception:
+            pass
+        if time.time() >= deadline:
+            return False
+        if on_poll:
+            on_poll()
+        time.sleep(interval)
+
+
 def handle_selenium(url):
     if not check_selenium_folder_access():
         if not check_admin_privileges():
@@ -2135,32 +2865,23 @@ def handle_selenium(url):
     # Method 1: Try headless mode with CDP solve_captcha (no visible window)
     try:
         check_seleniumbase_version()
-        with SB(uc=True, headless=True) as sb:
+        with get_browser_pool().session(headless=True) as browser:
+            sb = browser.sb
             try:
-                sb.activate_cdp_mode(url)
-                sb.sleep(3)
-                
+                browser.open(url)
+                selectors = get_ready_selectors(url)
+
                 for attempt in range(5):
+                    if wait_for_page_ready(sb, selectors, timeout=3 if attempt == 0 else 6):
+                        break
                     sb.cdp.solve_captcha()
-                    sb.sleep(4)
-                    
-                    source = sb.cdp.get_page_source()
-                    waiting_msg = [f"Waiting for {url.split('/')[2]} to respond...", "security verification"]
-                    if all(msg not in source for msg in waiting_msg) and len(source) > 5000:
-                        sb.cdp.scroll_down(100)
-                        sb.sleep(2)
-                        source = sb.cdp.get_page_source()
-                        return source
-                    
-                    if attempt < 2:
-                        sb.sleep(2)
-                
+
                 sb.cdp.scroll_down(100)
-                sb.sleep(2)
                 source = sb.cdp.get_page_source()
-                if f"Waiting for {url.split('/')[2]} to respond..." in source:
-                    raise Exception("Error: Waiting for website to respond...")
+                if is_challenge_page(url, source):
+                    raise Exception("Error: The security verification did not clear...")
                 if len(source) > 5000:
+                    save_browser_clearance(sb, url)
                     return source
                 raise Exception("Page content too small, trying headed mode...")
             finally:
@@ -2173,23 +2894,28 @@ def handle_selenium(url):
     try:
         print("\nFalling back to headed browser mode...")
         check_seleniumbase_version()
-        with SB(uc=True) as sb:
+        with get_browser_pool().session(headless=False) as browser:
+            sb = browser.sb
             try:
-                sb.activate_cdp_mode(url)
-                sb.sleep(5)
-                sb.uc_gui_click_captcha()
-                sb.sleep(3)
+                browser.open(url)
+                if not wait_for_page_ready(sb, get_ready_selectors(url), timeout=5):
+                    sb.uc_gui_click_captcha()
+                    wait_for_page_ready(sb, get_ready_selectors(url), timeout=10)
                 source = sb.cdp.get_page_source()
-                if f"Waiting for {url.split('/')[2]} to respond..." in source:
-                    raise Exception("Error: Waiting for website to respond...")
+                if is_challenge_page(url, source):
+                    raise Exception("Error: The security verification did not clear...")
+                save_browser_clearance(sb, url)
                 return source
             except Exception:
                 try:
-                    sb.activate_cdp_mode(url)
-                    sb.sleep(5)
-                    sb.uc_gui_handle_captcha()
-                    sb.sleep(3)
+                    browser.open(url)
+                    if not wait_for_page_ready(sb, get_ready_selectors(url), timeout=5):
+                        sb.uc_gui_handle_captcha()
+                        wait_for_page_ready(sb, get_ready_selectors(url), timeout=10)
                     source = sb.cdp.get_page_source()
+                    if is_challenge_page(url, source):
+                        raise Exception("Error: The security verification did not clear.")
+                    save_browser_clearance(sb, url)
                     return source
                 except Exception as e:
                     if not is_permission_error(e):
@@ -2208,20 +2934,23 @@ def selenium_get_latest_streams_from_twitchtracker(streamer_name):
     url = f"https://twitchtracker.com/{streamer_name}/streams"
     try:
         check_seleniumbase_version()
-        with SB(uc=True) as sb:
+        with get_browser_pool().session(headless=False) as browser:
+            sb = browser.sb
             try:
-                sb.activate_cdp_mode(url)
-                sb.sleep(5)
-                sb.uc_gui_click_captcha()
-                sb.sleep(4)
+                browser.open(url)
+                if not wait_for_page_ready(sb, get_ready_selectors(url), timeout=5):
+                    sb.uc_gui_click_captcha()
+                    wait_for_page_ready(sb, get_ready_selectors(url), timeout=10)
                 sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                save_browser_clearance(sb, url)
             except Exception:
                 try:
-                    sb.activate_cdp_mode(url)
-                    sb.sleep(5)
-                    sb.uc_gui_handle_captcha()
-                    sb.sleep(4)
+                    browser.open(url)
+                    if not wait_for_page_ready(sb, get_ready_selectors(url), timeout=5):
+                        sb.uc_gui_handle_captcha()
+                        wait_for_page_ready(sb, get_ready_selectors(url), timeout=10)
                     sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    save_browser_clearance(sb, url)
                 except Exception as e:
                     print(e)
             finally:
@@ -2404,8 +3133,265 @@ def selenium_cleanup():
         pass
 
 
-def parse_streamscharts_duration_data(bs):
-    streamscharts_duration = bs.find_all("div", {"class": "text-xs font-bold"})[3].text
+CLEARANCE_LOCK = threading.Lock()
+
+
+def get_clearance_file_path():
+    cache_dir = os.path.join(get_script_directory(), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "clearance.json")
+
+
+def load_clearance_store():
+    try:
+        with open(get_clearance_file_path(), "r", encoding="utf-8") as clearance_file:
+            return json.load(clearance_file)
+    except Exception:
+        return {}
+
+
+def write_clearance_store(store):
+    try:
+        with open(get_clearance_file_path(), "w", encoding="utf-8") as clearance_file:
+            json.dump(store, clearance_file, indent=4)
+    except Exception:
+        pass
+
+
+def save_browser_clearance(sb, url):
+    # cf_clearance is tied to the browser's user agent, so both are stored together per domain,
+    # and only once the page has really cleared so a pending challenge's cookies are never reused
+    try:
+        if is_challenge_page(url, sb.cdp.get_page_source()):
+            return
+        domain = urlparse(url).hostname
+        cookies = {}
+        for cookie in sb.cdp.get_all_cookies():
+            if isinstance(cookie, dict):
+                name, value, cookie_domain, expires = cookie.get("name"), cookie.get("value"), cookie.get("domain", ""), cookie.get("expires", -1)
+            else:
+                name, value, cookie_domain, expires = cookie.name, cookie.value, cookie.domain or "", getattr(cookie, "expires", -1)
+            if name and domain.endswith(cookie_domain.lstrip(".")):
+                cookies[name] = {"value": value, "expires": expires if expires is not None else -1}
+        if not cookies:
+            return
+        user_agent = sb.cdp.evaluate("navigator.userAgent")
+        with CLEARANCE_LOCK:
+            store = load_clearance_store()
+            store[domain] = {"user_agent": user_agent, "cookies": cookies, "saved_at": time.time()}
+            write_clearance_store(store)
+    except Exception:
+        pass
+
+
+def get_browser_clearance(url):
+    # Returns (headers, cookies) for url, reusing a stored browser identity when one is still valid
+    entry = load_clearance_store().get(urlparse(url).hostname)
+    if not entry or not entry.get("user_agent"):
+        return return_user_agent(), {}
+    now = time.time()
+    cookies = {
+        name: cookie["value"]
+        for name, cookie in entry.get("cookies", {}).items()
+        if not (cookie.get("expires", -1) > 0 and cookie["expires"] < now)
+    }
+    return {"user-agent": entry["user_agent"]}, cookies
+
+
+def drop_browser_clearance(url):
+    with CLEARANCE_LOCK:
+        store = load_clearance_store()
+        if store.pop(urlparse(url).hostname, None) is not None:
+            write_clearance_store(store)
+
+
+TRACKER_PAGE_MARKERS = {
+    "twitchtracker.com": ["stream-timestamp-dt", "g-x-s-value"],
+    "streamscharts.com": ["ml-2 font-bold", "text-xs font-bold"],
+    "sullygnome.com": ["MiddleSubHeaderItemValue"],
+}
+TRACKER_RECENT_CACHE_MINUTES = 10
+
+
+def parse_tracker_datetime_data(url, source):
+    hostname = urlparse(url).hostname or ""
+    if hostname.endswith("twitchtracker.com"):
+        return parse_twitchtracker_datetime_data(source)
+    if hostname.endswith("streamscharts.com"):
+        return parse_streamscharts_datetime_data(source)
+    if hostname.endswith("sullygnome.com"):
+        return parse_sullygnome_datetime_data(source)
+    return None, None
+
+
+def is_recent_tracker_page(url, html):
+    # A stream that may still be live keeps changing its page, trackers don't all use UTC so a day of margin is kept
+    try:
+        stream_datetime, duration = parse_tracker_datetime_data(url, html)
+        ended_at = datetime.strptime(stream_datetime, "%Y-%m-%d %H:%M:%S") + timedelta(minutes=duration or 0)
+        return datetime.now() - ended_at < timedelta(days=1)
+    except Exception:
+        return True
+
+
+def is_cacheable_tracker_page(url, html):
+    # Challenge pages and half rendered pages come back with status 200 too, only pages carrying the data are kept
+    if is_challenge_page(url, html):
+        return False
+    hostname = urlparse(url).hostname or ""
+    for domain, markers in TRACKER_PAGE_MARKERS.items():
+        if hostname.endswith(domain):
+            return any(marker in html for marker in markers)
+    return False
+
+
+def get_tracker_cache_paths(url):
+    cache_dir = os.path.join(get_script_directory(), "cache", "tracker")
+    os.makedirs(cache_dir, exist_ok=True)
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.html"), os.path.join(cache_dir, f"{key}.json")
+
+
+def load_tracker_page(url):
+    try:
+        html_path, meta_path = get_tracker_cache_paths(url)
+        with open(meta_path, "r", encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        with open(html_path, "r", encoding="utf-8") as html_file:
+            return html_file.read(), meta
+    except Exception:
+        return None, None
+
+
+def store_tracker_page(url, html, rendered=False, etag=None, last_modified=None):
+    if not is_cacheable_tracker_page(url, html):
+        return
+    try:
+        html_path, meta_path = get_tracker_cache_paths(url)
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write(html)
+        meta = {
+            "url": url, "fetched_at": time.time(), "rendered": rendered, "etag": etag, "last_modified": last_modified,
+            "recent": is_recent_tracker_page(url, html),
+        }
+        with open(meta_path, "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file)
+    except Exception:
+        pass
+
+
+def fetch_tracker_page(url, use_browser=False):
+    # Serves tracker pages from cache/tracker so every scraper shares one fetch (and one browser render) per page
+    cached_html, meta = load_tracker_page(url)
+    max_age = TRACKER_RECENT_CACHE_MINUTES * 60 if meta and meta.get("recent", True) else get_tracker_cache_hours() * 3600
+    is_fresh = meta is not None and time.time() - meta.get("fetched_at", 0) < max_age
+
+    if use_browser:
+        if is_fresh and meta.get("rendered"):
+            return cached_html
+        source = handle_selenium(url)
+        if source:
+            store_tracker_page(url, source, rendered=True)
+        return source
+
+    if is_fresh:
+        return cached_html
+
+    headers, cookies = get_browser_clearance(url)
+    if cached_html is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    try:
+        response = http_get(url, headers=headers, cookies=cookies, timeout=10)
+    except Exception:
+        return None
+
+    if response.status_code in (403, 503) and cookies:
+        drop_browser_clearance(url)
+    if response.status_code == 304 and cached_html is not None:
+        store_tracker_page(url, cached_html, meta.get("rendered", False), meta.get("etag"), meta.get("last_modified"))
+        return cached_html
+    if response.status_code == 200:
+        store_tracker_page(url, response.text, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+        return response.text
+    return None
+
+
+TRACKER_TAG_PATTERNS = {}
+# Attribute values may be quoted and contain ">", so tags are matched attribute by attribute
+TRACKER_TAG_BODY = r"""((?:[^>"']|"[^"]*"|'[^']*')*)"""
+TRACKER_INNER_TAG_PATTERN = re.compile(rf"<{TRACKER_TAG_BODY}>")
+TRACKER_META_PATTERN = re.compile(rf"<meta\b{TRACKER_TAG_BODY}>", re.IGNORECASE)
+TRACKER_ATTRIBUTE_PATTERN = re.compile(r"""([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+TRACKER_HIDDEN_PATTERN = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def strip_hidden_markup(source):
+    # Scripts, styles and comments can hold markup-like text that bs4 never treats as tags
+    return TRACKER_HIDDEN_PATTERN.sub("", source)
+
+
+def parse_tag_attributes(body):
+    return {key.lower(): unescape(double or single or bare) for key, double, single, bare in TRACKER_ATTRIBUTE_PATTERN.findall(body)}
+
+
+def find_tag_text(source, tag, class_name, index):
+    # Scans for the index-th <tag> matching class_name the way bs4's class filter does,
+    # returning None whenever the markup is too irregular to answer without a real parser
+    source = strip_hidden_markup(source)
+    if re.search(r"<!--|<script\b|<style\b", source, re.IGNORECASE):
+        return None
+    patterns = TRACKER_TAG_PATTERNS.get(tag)
+    if patterns is None:
+        patterns = TRACKER_TAG_PATTERNS[tag] = (
+            re.compile(rf"<{tag}\b{TRACKER_TAG_BODY}>", re.IGNORECASE),
+            re.compile(rf"</{tag}\s*>", re.IGNORECASE),
+        )
+    open_pattern, close_pattern = patterns
+
+    count = 0
+    for match in open_pattern.finditer(source):
+        class_value = parse_tag_attributes(match.group(1)).get("class")
+        if class_value is None:
+            continue
+        classes = class_value.split()
+        if (" ".join(classes) == class_name) if " " in class_name else (class_name in classes):
+            if count == index:
+                end = close_pattern.search(source, match.end())
+                if end is None:
+                    return None
+                inner = source[match.end():end.start()]
+                if open_pattern.search(inner):
+                    return None
+                return unescape(TRACKER_INNER_TAG_PATTERN.sub("", inner))
+            count += 1
+    return None
+
+
+def extract_tag_text(source, tag, class_name, index):
+    text = find_tag_text(source, tag, class_name, index)
+    if text is not None:
+        return text
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(source, "html.parser").find_all(tag, {"class": class_name})[index].text
+
+
+def extract_meta_content(source, name):
+    for match in TRACKER_META_PATTERN.finditer(strip_hidden_markup(source)):
+        attributes = parse_tag_attributes(match.group(1))
+        if attributes.get("name") == name:
+            return attributes.get("content")
+    from bs4 import BeautifulSoup
+
+    description_meta = BeautifulSoup(source, "html.parser").find("meta", {"name": name})
+    return description_meta.get("content") if description_meta else None
+
+
+def parse_streamscharts_duration_data(source):
+    streamscharts_duration = extract_tag_text(source, "div", "text-xs font-bold", 3)
     streamscharts_duration_in_minutes = parse_website_duration(streamscharts_duration)
     return streamscharts_duration_in_minutes
 
@@ -2413,20 +3399,18 @@ def parse_streamscharts_duration_data(bs):
 def parse_duration_streamscharts(streamscharts_url):
     # Method 1: Using requests
     try:
-        response = requests.get(streamscharts_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_streamscharts_duration_data(bs), response.text
+        source = fetch_tracker_page(streamscharts_url)
+        if source:
+            return parse_streamscharts_duration_data(source), source
     except Exception:
         pass
 
     # Method 2: Using Selenium
     print("Opening Streamcharts with browser...")
-    source = handle_selenium(streamscharts_url)
+    source = fetch_tracker_page(streamscharts_url, use_browser=True)
     if source:
         try:
-            bs = BeautifulSoup(source, "html.parser")
-            return parse_streamscharts_duration_data(bs), source
+            return parse_streamscharts_duration_data(source), source
         except Exception:
             return None, source
 
@@ -2437,8 +3421,8 @@ def parse_duration_streamscharts(streamscharts_url):
     return None, None
 
 
-def parse_twitchtracker_duration_data(bs):
-    twitchtracker_duration = bs.find_all("div", {"class": "g-x-s-value"})[0].text
+def parse_twitchtracker_duration_data(source):
+    twitchtracker_duration = extract_tag_text(source, "div", "g-x-s-value", 0)
     twitchtracker_duration_in_minutes = parse_website_duration(twitchtracker_duration)
     return twitchtracker_duration_in_minutes
 
@@ -2446,17 +3430,15 @@ def parse_twitchtracker_duration_data(bs):
 def parse_duration_twitchtracker(twitchtracker_url, try_alternative=True):
     try:
         # Method 1: Using requests
-        response = requests.get(twitchtracker_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_twitchtracker_duration_data(bs), response.text
+        source = fetch_tracker_page(twitchtracker_url)
+        if source:
+            return parse_twitchtracker_duration_data(source), source
 
         # Method 2: Using Selenium
         print("Opening Twitchtracker with browser...")
-        source = handle_selenium(twitchtracker_url)
+        source = fetch_tracker_page(twitchtracker_url, use_browser=True)
 
-        bs = BeautifulSoup(source, "html.parser")
-        return parse_twitchtracker_duration_data(bs), source
+        return parse_twitchtracker_duration_data(source), source
 
     except Exception:
         pass
@@ -2468,8 +3450,8 @@ def parse_duration_twitchtracker(twitchtracker_url, try_alternative=True):
     return None, None
 
 
-def parse_sullygnome_duration_data(bs):
-    sullygnome_duration = bs.find_all("div", {"class": "MiddleSubHeaderItemValue"})[7].text.split(",")
+def parse_sullygnome_duration_data(source):
+    sullygnome_duration = extract_tag_text(source, "div", "MiddleSubHeaderItemValue", 7).split(",")
     sullygnome_duration_in_minutes = parse_website_duration(sullygnome_duration)
     return sullygnome_duration_in_minutes
 
@@ -2477,17 +3459,15 @@ def parse_sullygnome_duration_data(bs):
 def parse_duration_sullygnome(sullygnome_url):
     try:
         # Method 1: Using requests
-        response = requests.get(sullygnome_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_sullygnome_duration_data(bs)
+        source = fetch_tracker_page(sullygnome_url)
+        if source:
+            return parse_sullygnome_duration_data(source)
 
         # Method 2: Using Selenium
         print("Opening Sullygnome with browser...")
-        source = handle_selenium(sullygnome_url)
+        source = fetch_tracker_page(sullygnome_url, use_browser=True)
 
-        bs = BeautifulSoup(source, "html.parser")
-        return parse_sullygnome_duration_data(bs)
+        return parse_sullygnome_duration_data(source)
 
     except Exception:
         pass
@@ -2522,9 +3502,9 @@ def scrape_clip_slugs_from_tracker_page(tracker_url, prefetched_html=None):
             return slugs
 
     try:
-        response = requests.get(tracker_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            slugs = extract_slugs_from_html(response.content)
+        source = fetch_tracker_page(tracker_url)
+        if source:
+            slugs = extract_slugs_from_html(source)
             if slugs:
                 return slugs
     except Exception:
@@ -2544,28 +3524,31 @@ def scrape_clip_slugs_from_tracker_page(tracker_url, prefetched_html=None):
         })();
     """
 
-    def _poll_for_clips(sb, max_attempts=15):
-        for attempt in range(max_attempts):
-            source = sb.cdp.get_page_source()
-            if "twitch-clips-thumbnails-prod" in source:
-                return extract_slugs_from_html(source)
+    def _poll_for_clips(sb, timeout=30):
+        def trigger_lazy_load():
             try:
                 sb.cdp.evaluate(TRIGGER_LAZY_JS)
             except Exception:
                 pass
             sb.cdp.scroll_down(500)
-            sb.sleep(2)
-        return extract_slugs_from_html(sb.cdp.get_page_source())
+
+        wait_for_page_ready(sb, CLIP_THUMBNAIL_SELECTORS, timeout=timeout, interval=1, on_poll=trigger_lazy_load)
+        source = sb.cdp.get_page_source()
+        if "twitch-clips-thumbnails-prod" in source:
+            store_tracker_page(tracker_url, source, rendered=True)
+            save_browser_clearance(sb, tracker_url)
+        return extract_slugs_from_html(source)
 
     def _selenium_scrape():
         try:
             check_seleniumbase_version()
-            with SB(uc=True, headless=True) as sb:
+            with get_browser_pool().session(headless=True) as browser:
+                sb = browser.sb
                 try:
-                    sb.activate_cdp_mode(tracker_url)
-                    sb.sleep(3)
-                    sb.cdp.solve_captcha()
-                    sb.sleep(4)
+                    browser.open(tracker_url)
+                    if not wait_for_page_ready(sb, get_ready_selectors(tracker_url), timeout=3):
+                        sb.cdp.solve_captcha()
+                        wait_for_page_ready(sb, get_ready_selectors(tracker_url), timeout=8)
                     result = _poll_for_clips(sb)
                     if result:
                         return result
@@ -2575,12 +3558,13 @@ def scrape_clip_slugs_from_tracker_page(tracker_url, prefetched_html=None):
             pass
 
         try:
-            with SB(uc=True) as sb:
+            with get_browser_pool().session(headless=False) as browser:
+                sb = browser.sb
                 try:
-                    sb.activate_cdp_mode(tracker_url)
-                    sb.sleep(5)
-                    sb.uc_gui_click_captcha()
-                    sb.sleep(3)
+                    browser.open(tracker_url)
+                    if not wait_for_page_ready(sb, get_ready_selectors(tracker_url), timeout=5):
+                        sb.uc_gui_click_captcha()
+                        wait_for_page_ready(sb, get_ready_selectors(tracker_url), timeout=10)
                     result = _poll_for_clips(sb)
                     if result:
                         return result
@@ -2593,10 +3577,10 @@ def scrape_clip_slugs_from_tracker_page(tracker_url, prefetched_html=None):
     return _selenium_scrape()
 
 
-def parse_streamscharts_datetime_data(bs):
+def parse_streamscharts_datetime_data(source):
     stream_date = (
-        bs.find_all("time", {"class": "ml-2 font-bold"})[0]
-        .text.strip()
+        extract_tag_text(source, "time", "ml-2 font-bold", 0)
+        .strip()
         .replace(",", "")
         + ":00"
     )
@@ -2604,7 +3588,7 @@ def parse_streamscharts_datetime_data(bs):
 
 
     try:
-        streamcharts_duration = bs.find_all("span", {"class": "mx-2 font-bold"})[0].text
+        streamcharts_duration = extract_tag_text(source, "span", "mx-2 font-bold", 0)
         streamcharts_duration_in_minutes = parse_website_duration(streamcharts_duration)
     except Exception:
         streamcharts_duration_in_minutes = None
@@ -2624,30 +3608,26 @@ def parse_datetime_streamscharts(streamscharts_url, skip_gql=False):
                 return stream_datetime
 
         # Method 2: Using requests
-        response = requests.get(
-            streamscharts_url, headers=return_user_agent(), timeout=10
-        )
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_streamscharts_datetime_data(bs)
+        source = fetch_tracker_page(streamscharts_url)
+        if source:
+            return parse_streamscharts_datetime_data(source)
 
         # Method 3: Using Selenium
         print("\nOpening Streamscharts with browser...")
 
-        source = handle_selenium(streamscharts_url)
+        source = fetch_tracker_page(streamscharts_url, use_browser=True)
 
-        bs = BeautifulSoup(source, "html.parser")
-        return parse_streamscharts_datetime_data(bs)
+        return parse_streamscharts_datetime_data(source)
 
     except Exception:
         pass
     return None, None
 
 
-def parse_twitchtracker_datetime_data(bs):
-    twitchtracker_datetime = bs.find_all("div", {"class": "stream-timestamp-dt"})[0].text
+def parse_twitchtracker_datetime_data(source):
+    twitchtracker_datetime = extract_tag_text(source, "div", "stream-timestamp-dt", 0)
     try:
-        twitchtracker_duration = bs.find_all("div", {"class": "g-x-s-value"})[0].text
+        twitchtracker_duration = extract_tag_text(source, "div", "g-x-s-value", 0)
         twitchtracker_duration_in_minutes = parse_website_duration(twitchtracker_duration)
     except Exception:
         twitchtracker_duration_in_minutes = None
@@ -2667,28 +3647,25 @@ def parse_datetime_twitchtracker(twitchtracker_url, skip_gql=False):
                 return stream_datetime
 
         # Method 2: Using requests
-        response = requests.get(twitchtracker_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_twitchtracker_datetime_data(bs)
+        source = fetch_tracker_page(twitchtracker_url)
+        if source:
+            return parse_twitchtracker_datetime_data(source)
 
         # Method 3: Using Selenium
         print("\nOpening Twitchtracker with browser...")
 
-        source = handle_selenium(twitchtracker_url)
+        source = fetch_tracker_page(twitchtracker_url, use_browser=True)
 
-        bs = BeautifulSoup(source, "html.parser")
-        description_meta = bs.find("meta", {"name": "description"})
+        description_content = extract_meta_content(source, "description")
         twitchtracker_datetime = None
 
-        if description_meta:
-            description_content = description_meta.get("content")
+        if description_content:
             match = re.search(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", description_content)
             if match:
                 twitchtracker_datetime = match.group(0)
 
                 try:
-                    twitchtracker_duration = bs.find_all("div", {"class": "g-x-s-value"})[0].text
+                    twitchtracker_duration = extract_tag_text(source, "div", "g-x-s-value", 0)
                     twitchtracker_duration_in_minutes = parse_website_duration(twitchtracker_duration)
                 except Exception:
                     twitchtracker_duration_in_minutes = None
@@ -2699,13 +3676,13 @@ def parse_datetime_twitchtracker(twitchtracker_url, skip_gql=False):
     return None, None
 
 
-def parse_sullygnome_datetime_data(bs):
-    stream_date = bs.find_all("div", {"class": "MiddleSubHeaderItemValue"})[6].text
+def parse_sullygnome_datetime_data(source):
+    stream_date = extract_tag_text(source, "div", "MiddleSubHeaderItemValue", 6)
     modified_stream_date = remove_chars_from_ordinal_numbers(stream_date)
     formatted_stream_date = datetime.strptime(f"{datetime.now().year} {modified_stream_date}", "%Y %A %d %B %I:%M%p").strftime("%m-%d %H:%M:%S")
     sullygnome_datetime = str(datetime.now().year) + "-" + formatted_stream_date
 
-    sullygnome_duration = bs.find_all("div", {"class": "MiddleSubHeaderItemValue"})[7].text.split(",")
+    sullygnome_duration = extract_tag_text(source, "div", "MiddleSubHeaderItemValue", 7).split(",")
     sullygnome_duration_in_minutes = parse_website_duration(sullygnome_duration)
 
     return sullygnome_datetime, sullygnome_duration_in_minutes
@@ -2722,23 +3699,70 @@ def parse_datetime_sullygnome(sullygnome_url, skip_gql=False):
             if stream_datetime and stream_datetime != (None, None):
                 return stream_datetime
         # Method 2: Using requests
-        response = requests.get(sullygnome_url, headers=return_user_agent(), timeout=10)
-        if response.status_code == 200:
-            bs = BeautifulSoup(response.content, "html.parser")
-            return parse_sullygnome_datetime_data(bs)
+        source = fetch_tracker_page(sullygnome_url)
+        if source:
+            return parse_sullygnome_datetime_data(source)
 
         # Method 3: Using Selenium
         print("\nOpening Sullygnome with browser...")
-        source = handle_selenium(sullygnome_url)
+        source = fetch_tracker_page(sullygnome_url, use_browser=True)
 
-        bs = BeautifulSoup(source, "html.parser")
-        return parse_sullygnome_datetime_data(bs)
+        return parse_sullygnome_datetime_data(source)
 
     except Exception:
         pass
     return None, None
 
 
+def absolutize_map_line(line, base_link):
+    try:
+        prefix, uri_part = line.split("URI=", 1)
+        if uri_part.startswith('"'):
+            end_quote = uri_part.find('"', 1)
+            raw_uri = uri_part[1:end_quote]
+            return f"{prefix}URI=\"{ensure_absolute_uri(raw_uri, base_link)}\"\n"
+        raw_uri = uri_part.strip().split(",")[0]
+        return f"#EXT-X-MAP:URI=\"{ensure_absolute_uri(raw_uri, base_link)}\"\n"
+    except Exception:
+        return line
+
+
+def rewrite_playlist_lines(lines, base_link, unmute=False):
+    # Returns the playlist lines with absolute segment and init URIs, plus the segment URLs in order
+    output_lines = []
+    segment_list = []
+    for line in lines:
+        if line.startswith("#"):
+            if line.startswith("#EXT-X-MAP") and "URI=" in line:
+                line = absolutize_map_line(line, base_link)
+            output_lines.append(line)
+            continue
+
+        segment_uri = line.strip()
+        if not segment_uri:
+            output_lines.append(line)
+            continue
+
+        if unmute and "-unmuted" in segment_uri:
+            segment_uri = segment_uri.replace("-unmuted", "-muted")
+        absolute_segment = ensure_absolute_uri(segment_uri, base_link)
+        output_lines.append(f"{absolute_segment}\n")
+        segment_list.append(absolute_segment)
+    return output_lines, segment_list
+
+
+def mark_invalid_segment_lines(lines, valid_segments):
+    # Comments out every .ts line that did not validate, set lookups keep 50k segment VODs linear
+    valid_segments = set(valid_segments)
+    modified_playlist = []
+    for line in lines:
+        if line in valid_segments or line.startswith("#") or not line.endswith(".ts"):
+            modified_playlist.append(line)
+        else:
+            modified_playlist.append("#" + line)
+    return modified_playlist
+
+
 def unmute_vod(m3u8_link):
     video_filepath = get_vod_filepath(parse_streamer_from_m3u8_link(m3u8_link), parse_video_id_from_m3u8_link(m3u8_link))
     
@@ -2751,36 +3775,8 @@ def unmute_vod(m3u8_link):
         is_muted = is_video_muted(m3u8_link)
         base_link = m3u8_link.replace("index-dvr.m3u8", "")
 
-        for line in file_contents:
-            if line.startswith("#"):
-                if line.startswith("#EXT-X-MAP") and "URI=" in line:
-                    try:
-                        prefix, uri_part = line.split("URI=", 1)
-                        if uri_part.startswith('"'):
-                            end_quote = uri_part.find('"', 1)
-                            raw_uri = uri_part[1:end_quote]
-                            absolute_uri = ensure_absolute_uri(raw_uri, base_link)
-                            line = f"{prefix}URI=\"{absolute_uri}\"\n"
-                        else:
-                            raw_uri = uri_part.strip().split(",")[0]
-                            absolute_uri = ensure_absolute_uri(raw_uri, base_link)
-                            line = f"#EXT-X-MAP:URI=\"{absolute_uri}\"\n"
-                    except Exception:
-                        pass
-                video_file.write(line)
-                continue
-
-            segment_uri = line.strip()
-            if not segment_uri:
-                video_file.write(line)
-                continue
-
-            if "-unmuted" in segment_uri:
-                segment_uri = segment_uri.replace("-unmuted", "-muted")
-            absolute_segment = ensure_absolute_uri(segment_uri, base_link)
-
-            video_file.write(f"{absolute_segment}\n")
-
+        output_lines, _ = rewrite_playlist_lines(file_contents, base_link, unmute=True)
+        video_file.writelines(output_lines)
         video_file.truncate()
     
     if is_muted:
@@ -2804,25 +3800,15 @@ def mark_invalid_segments_in_playlist(m3u8_link):
         os.remove(vod_file_path)
         return
     
-    playlist_segments = [segment for segment in segments if segment in lines]
-    modified_playlist = []
-    for line in lines:
-        if line in playlist_segments:
-            modified_playlist.append(line)
-        elif line.startswith("#"):
-            modified_playlist.append(line)
-        elif line.endswith(".ts"):
-            modified_playlist.append("#" + line)
-        else:
-            modified_playlist.append(line)
+    modified_playlist = mark_invalid_segment_lines(lines, segments)
     with open(vod_file_path, "w", encoding="utf-8") as f:
         f.write("\n".join(modified_playlist))
-    input("Press Enter to continue...")
+    wait_for_enter()
 
 
 def return_m3u8_duration(m3u8_link):
     total_duration = 0
-    file_contents = requests.get(m3u8_link, stream=True, timeout=30).text.splitlines()
+    file_contents = http_get(m3u8_link, stream=True, timeout=30).text.splitlines()
     for line in file_contents:
         if line.startswith("#EXTINF:"):
             segment_duration = float(line.split(":")[1].split(",")[0])
@@ -2843,6 +3829,7 @@ def check_if_unmuted_is_playable(m3u8_source):
             
             process = await asyncio.create_subprocess_exec(
                 *cmd,
+                stdin=get_tool_stdin(),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
@@ -2876,7 +3863,7 @@ def process_m3u8_configuration(m3u8_link, skip_check=False):
     generated_path = os.path.join(get_default_directory(), f"vod_{vod_id}_generated.m3u8")
     is_blocked_vod = False
     try:
-        response = requests.head(m3u8_link, timeout=10)
+        response = http_head(m3u8_link, timeout=10)
         is_blocked_vod = response.status_code in (403, 404, 410)
     except Exception:
         pass
@@ -2922,41 +3909,14 @@ def get_all_playlist_segments(m3u8_link):
     video_file_path = get_vod_filepath(parse_streamer_from_m3u8_link(m3u8_link), parse_video_id_from_m3u8_link(m3u8_link))
     write_m3u8_to_file(m3u8_link, video_file_path)
 
-    segment_list = []
     base_link = m3u8_link.replace("index-dvr.m3u8", "")
-    
+
     with open(video_file_path, "r+", encoding="utf-8") as video_file:
         file_contents = video_file.readlines()
         video_file.seek(0)
 
-        for line in file_contents:
-            if line.startswith("#"):
-                if line.startswith("#EXT-X-MAP") and "URI=" in line:
-                    try:
-                        prefix, uri_part = line.split("URI=", 1)
-                        if uri_part.startswith('"'):
-                            end_quote = uri_part.find('"', 1)
-                            raw_uri = uri_part[1:end_quote]
-                            absolute_uri = ensure_absolute_uri(raw_uri, base_link)
-                            line = f"{prefix}URI=\"{absolute_uri}\"\n"
-                        else:
-                            raw_uri = uri_part.strip().split(",")[0]
-                            absolute_uri = ensure_absolute_uri(raw_uri, base_link)
-                            line = f"#EXT-X-MAP:URI=\"{absolute_uri}\"\n"
-                    except Exception:
-                        pass
-                video_file.write(line)
-                continue
-
-            segment_uri = line.strip()
-            if not segment_uri:
-                video_file.write(line)
-                continue
-
-            absolute_segment = ensure_absolute_uri(segment_uri, base_link)
-            video_file.write(f"{absolute_segment}\n")
-            segment_list.append(absolute_segment)
-
+        output_lines, segment_list = rewrite_playlist_lines(file_contents, base_link)
+        video_file.writelines(output_lines)
         video_file.truncate()
     return segment_list
 
@@ -3061,7 +4021,7 @@ def try_alternate_timestamps(streamer_name, video_id, timestamp, alternate_websi
                 if parsed_timestamp in asked_same_timestamps:
                     print("Already handled same timestamp, skipping...")
                 else:
-                    if get_yes_no_choice("Do you want to retry with the same timestamp?"):
+                    if get_yes_no_choice("Do you want to retry with the same timestamp?", default=True):
                         asked_same_timestamps.add(parsed_timestamp)
                         vod_url = run_vod_recovery(streamer_name, video_id, parsed_timestamp)
                         if vod_url:
@@ -3082,7 +4042,7 @@ def vod_recover(streamer_name, video_id, timestamp, tracker_url=None):
             print("Video is older than 60 days. Chances of recovery are very slim.")
         vod_url = None
 
-        if timestamp:
+        if timestamp or lookup_vod_path(streamer_name, video_id):
             m3u8_url = run_vod_recovery(streamer_name, video_id, timestamp)
             vod_url = return_supported_qualities(m3u8_url)
 
@@ -3103,7 +4063,7 @@ def vod_recover(streamer_name, video_id, timestamp, tracker_url=None):
 
                 if not input_datetime:
                     print("\033[91m \n✖  No datetime entered! \033[0m")
-                    input("\nPress Enter to continue...")
+                    wait_for_enter("\nPress Enter to continue...")
                     return_to_main_menu()
                 
                 vod_url = run_vod_recovery(streamer_name, video_id, input_datetime)
@@ -3113,7 +4073,7 @@ def vod_recover(streamer_name, video_id, timestamp, tracker_url=None):
 
             if not vod_url and tracker_url:
                 print("\033[91m \n✖  Unable to recover the video! \033[0m")
-                input("\nPress Enter to continue...")
+                wait_for_enter("\nPress Enter to continue...")
                 return_to_main_menu()
             else:
                 return None
@@ -3165,14 +4125,21 @@ def print_select_vod_menu(all_m3u8_links):
 def bulk_vod_recovery():
     csv_file_path = get_and_validate_csv_filename()
     streamer_name = parse_streamer_from_csv_filename(csv_file_path)
-    csv_file = parse_vod_csv_file(csv_file_path)
     print()
+
+    def recover(vod):
+        video_id, timestamp = vod
+        try:
+            return asyncio.run(get_vod_urls(streamer_name.lower(), video_id, timestamp, quiet=True))
+        except Exception:
+            return None
+
     all_m3u8_links = []
-    for timestamp, video_id in csv_file.items():
+    # Searches run quietly in the workers, every result is reported from here so lines never interleave
+    for (video_id, _), m3u8_link in map_bounded_ordered(recover, iter_vod_csv_file(csv_file_path), get_bulk_recovery_workers()):
         print("Recovering Video:", video_id)
-        m3u8_link = asyncio.run(get_vod_urls(streamer_name.lower(), video_id, timestamp))
-
         if m3u8_link is not None:
+            print(f"\033[92m✓ Found URL: {m3u8_link}\033[0m\n")
             process_m3u8_configuration(m3u8_link)
             all_m3u8_links.append((video_id, m3u8_link))
         else:
@@ -3202,7 +4169,7 @@ def bulk_vod_recovery():
                 break
             else:
                 print("Invalid choice. Please try again.")
-        input("\nPress Enter to continue...")
+        wait_for_enter("\nPress Enter to continue...")
 
 
 def clip_recover(streamer, video_id, duration, tracker_url=None, prefetched_html=None):
@@ -3215,13 +4182,8 @@ def clip_recover(streamer, video_id, duration, tracker_url=None, prefetched_html
 
     if slugs:
         print(f"Found {len(slugs)} clip(s) on tracker page. Fetching download URLs...")
-        for i, slug in enumerate(slugs, 1):
-            print(f"\r\033[K Fetching clip {i}/{len(slugs)}: {slug[:50]}...", end="", flush=True)
-            url = get_twitch_clip(slug, retries=2)
-            if url:
-                valid_url_list.append(url)
-                print(f" \033[92m✔\033[0m", end="", flush=True)
-        print()
+        clip_urls = get_twitch_clip_urls(slugs)
+        valid_url_list = list(clip_urls.values())
     else:
         print("No clips found! Returning to main menu.\n")
         return
@@ -3241,7 +4203,7 @@ def clip_recover(streamer, video_id, duration, tracker_url=None, prefetched_html
         for url in valid_url_list:
             write_text_file(url, get_log_filepath(streamer, video_id))
         if (read_config_by_key("settings", "AUTO_DOWNLOAD_CLIPS") or get_yes_no_choice("\nDo you want to download the recovered clips?")):
-            download_clips_gql(get_default_directory(), streamer, video_id, slugs, prefetched_urls=valid_url_list)
+            download_clips_gql(get_default_directory(), streamer, video_id, slugs, prefetched_urls=clip_urls)
         if read_config_by_key("settings", "REMOVE_LOG_FILE"):
             os.remove(get_log_filepath(streamer, video_id))
         else:
@@ -3253,6 +4215,9 @@ def clip_recover(streamer, video_id, duration, tracker_url=None, prefetched_html
 
 
 def get_and_validate_csv_filename():
+    import tkinter as tk
+    from tkinter import filedialog
+
     try:
         window = tk.Tk()
         window.wm_attributes("-topmost", 1)
@@ -3287,47 +4252,91 @@ def get_and_validate_csv_filename():
             file_path = input("Enter a valid path: ").strip(' "\'')
 
 
-def parse_clip_csv_file(file_path):
-    vod_info_dict = {}
-    lines = read_csv_file(file_path)[1:]
-    for line in lines:
-        if line:
-            stream_date = remove_chars_from_ordinal_numbers(line[1].replace('"', ""))
-            modified_stream_date = datetime.strptime(stream_date, "%A %d %B %Y %H:%M").strftime("%d-%B-%Y")
-            video_id = line[2].partition("stream/")[2].replace('"', "")
-            duration = line[3]
-            if video_id != "0":
-                max_clip_offset = calculate_max_clip_offset(int(duration))
-                vod_info_dict.update({video_id: (modified_stream_date, max_clip_offset)})
-    return vod_info_dict
-
-
-def parse_vod_csv_file(file_path):
-    vod_info_dict = {}
-    lines = read_csv_file(file_path)[1:]
-    for line in lines:
-        if line:
-            stream_date = remove_chars_from_ordinal_numbers(line[1].replace('"', ""))
-            modified_stream_date = datetime.strptime(stream_date, "%A %d %B %Y %H:%M").strftime("%Y-%m-%d %H:%M:%S")
-            video_id = line[2].partition("stream/")[2].split(",")[0].replace('"', "")
-            vod_info_dict.update({modified_stream_date: video_id})
-    return vod_info_dict
+def parse_sullygnome_row(row):
+    video_id = row[2].partition("stream/")[2].split(",")[0].replace('"', "")
+    stream_date = remove_chars_from_ordinal_numbers(row[1].replace('"', ""))
+    return video_id, datetime.strptime(stream_date, "%A %d %B %Y %H:%M")
+
+
+def iter_clip_csv_file(file_path):
+    # Yields (video_id, stream_date, max_clip_offset) once per video ID as rows are read
+    seen = set()
+    for line in iter_csv_rows(file_path):
+        try:
+            video_id, started = parse_sullygnome_row(line)
+            max_clip_offset = calculate_max_clip_offset(int(line[3]))
+        except (ValueError, IndexError, TypeError) as e:
+            print(f"Skipping malformed CSV row ({', '.join(line)[:80]}): {e}")
+            continue
+        if video_id == "0" or video_id in seen:
+            continue
+        seen.add(video_id)
+        yield video_id, started.strftime("%d-%B-%Y"), max_clip_offset
+
+
+def iter_vod_csv_file(file_path):
+    # Keyed by video ID, streams that started in the same minute are separate VODs
+    seen = set()
+    for line in iter_csv_rows(file_path):
+        try:
+            video_id, started = parse_sullygnome_row(line)
+        except (ValueError, IndexError, TypeError) as e:
+            print(f"Skipping malformed CSV row ({', '.join(line)[:80]}): {e}")
+            continue
+        if not video_id or video_id in seen:
+            continue
+        seen.add(video_id)
+        yield video_id, started.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def iter_sorted_csv_rows(file_path):
+    # Yields (started, video_id, row) newest first; exports already in that order stream straight through
+    def keyed_rows():
+        for row in iter_csv_rows(file_path):
+            try:
+                video_id, started = parse_sullygnome_row(row)
+            except (ValueError, IndexError, TypeError):
+                continue
+            yield started, video_id, row
+
+    previous = None
+    for started, _, _ in keyed_rows():
+        if previous is not None and started > previous:
+            yield from sorted(keyed_rows(), key=lambda item: item[0], reverse=True)
+            return
+        previous = started
+    yield from keyed_rows()
 
 
 def merge_csv_files(csv_filename, directory_path):
-    csv_list = [file for file in os.listdir(directory_path) if file.endswith(".csv")]
-    header_saved = False
-    with open(os.path.join(directory_path, f"{csv_filename.title()}_MERGED.csv"), "w", newline="", encoding="utf-8") as output_file:
+    output_name = f"{csv_filename.title()}_MERGED.csv"
+    output_path = os.path.join(directory_path, output_name)
+    # A merged file from an earlier run is an output, reading it back would only add duplicates
+    csv_list = [os.path.join(directory_path, file) for file in sorted(os.listdir(directory_path)) if file.endswith(".csv") and file != output_name]
+
+    header = None
+    for csv_path in csv_list:
+        with open(csv_path, "r", encoding="utf-8", newline="") as csv_file:
+            header = next(csv.reader(csv_file), None)
+        if header:
+            break
+
+    seen = set()
+    written = duplicates = 0
+    with open(output_path + ".part", "w", newline="", encoding="utf-8") as output_file:
         writer = csv.writer(output_file)
-        for file in csv_list:
-            reader = read_csv_file(os.path.join(directory_path, file))
-            header = reader[0]
-            if not header_saved:
-                writer.writerow(header)
-                header_saved = True
-            for row in reader[1:]:
-                writer.writerow(row)
-    print("CSV files merged successfully!")
+        if header:
+            writer.writerow(header)
+        merged = heapq.merge(*(iter_sorted_csv_rows(csv_path) for csv_path in csv_list), key=lambda item: item[0], reverse=True)
+        for _, video_id, row in merged:
+            if video_id in seen:
+                duplicates += 1
+                continue
+            seen.add(video_id)
+            writer.writerow(row)
+            written += 1
+    os.replace(output_path + ".part", output_path)
+    print(f"CSV files merged successfully! {written} streams, {duplicates} duplicates removed.")
 
 
 
@@ -3351,8 +4360,6 @@ def bulk_clip_recovery():
     elif bulk_recovery_option == "3":
         return_to_main_menu()
 
-    stream_info_dict = parse_clip_csv_file(csv_file_path)
-
     should_download = read_config_by_key("settings", "AUTO_DOWNLOAD_CLIPS")
     if not should_download:
         should_download = get_yes_no_choice("Do you want to download all clips recovered?")
@@ -3365,40 +4372,39 @@ def bulk_clip_recovery():
         else:
             should_keep_logs = get_yes_no_choice("Would you like to keep the log files containing links to the recovered clips?")
 
-    for video_id, values in stream_info_dict.items():
+    def scrape(vod):
+        tracker_url = f"https://twitchtracker.com/{streamer_name}/streams/{vod[0]}"
+        try:
+            slugs = scrape_clip_slugs_from_tracker_page(tracker_url)
+            return tracker_url, slugs, get_twitch_clip_urls(slugs, quiet=True) if slugs else {}
+        except Exception:
+            return tracker_url, [], {}
+
+    # Tracker pages are scraped by the workers while finished VODs are logged and downloaded here
+    for (video_id, stream_date, _), (tracker_url, slugs, clip_urls) in map_bounded_ordered(scrape, iter_clip_csv_file(csv_file_path), get_bulk_recovery_workers()):
         vod_counter += 1
         valid_counter = 0
 
         print(f"\nProcessing Past Broadcast:\n"
-              f"Stream Date: {values[0].replace('-', ' ')}\n"
+              f"Stream Date: {stream_date.replace('-', ' ')}\n"
               f"Vod ID: {video_id}\n"
-              f"Vod Number: {vod_counter} of {len(stream_info_dict)}\n")
-
-        tracker_url = f"https://twitchtracker.com/{streamer_name}/streams/{video_id}"
-        print(f"Scraping clips from: {tracker_url}")
-        slugs = scrape_clip_slugs_from_tracker_page(tracker_url)
+              f"Vod Number: {vod_counter}\n")
 
+        print(f"Scraped clips from: {tracker_url}")
         if not slugs:
             print("No clips found on tracker page. Moving on to next vod.")
             continue
 
-        print(f"Found {len(slugs)} clip(s). Fetching download URLs...")
-        valid_urls = []
-        for i, slug in enumerate(slugs, 1):
-            print(f"\r\033[K Fetching clip {i}/{len(slugs)}: {slug[:50]}...", end="", flush=True)
-            url = get_twitch_clip(slug, retries=2)
-            if url:
-                valid_counter += 1
-                valid_urls.append(url)
-                write_text_file(url, get_log_filepath(streamer_name, video_id))
-                print(f" \033[92m✔\033[0m", end="", flush=True)
-        print()
+        print(f"Found {len(slugs)} clip(s).")
+        for url in clip_urls.values():
+            valid_counter += 1
+            write_text_file(url, get_log_filepath(streamer_name, video_id))
 
         print(f"\n\033[92m{valid_counter} Clip(s) Found\033[0m\n")
 
         if valid_counter != 0:
             if should_download:
-                download_clips_gql(get_default_directory(), streamer_name, video_id, slugs, prefetched_urls=valid_urls)
+                download_clips_gql(get_default_directory(), streamer_name, video_id, slugs, prefetched_urls=clip_urls)
                 os.remove(get_log_filepath(streamer_name, video_id))
             else:
                 if not should_keep_logs:
@@ -3406,10 +4412,71 @@ def bulk_clip_recovery():
                 else:
                     print("\nRecovered links saved to " + get_log_filepath(streamer_name, video_id))
         else:
-            if len(stream_info_dict) > vod_counter:
-                print("No clips found!... Moving on to next vod.")
+            print("No clips found!... Moving on to next vod.")
+
+    wait_for_enter("\nPress Enter to continue...")
+
+
+async def stream_clip_to_file(session, url, file_path, retries=3, chunk_size=1024 * 1024):
+    # Writes to a .part file first so an interrupted clip never looks complete
+    part_path = file_path + ".part"
+    for attempt in range(retries):
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    written = 0
+                    with open(part_path, "wb") as clip_file:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            clip_file.write(chunk)
+                            written += len(chunk)
+                    os.replace(part_path, file_path)
+                    return written
+                if response.status in (403, 404):
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionResetError, OSError):
+            pass
+        if attempt != retries - 1:
+            await asyncio.sleep(1 + attempt)
+    if os.path.exists(part_path):
+        os.remove(part_path)
+    return None
+
+
+async def download_clip_files(jobs, workers=CLIP_DOWNLOAD_WORKERS):
+    # jobs is a list of (url, file_path, label); returns the labels that failed
+    failed = []
+    done = 0
+    total_bytes = 0
+    start = time.time()
+    semaphore = asyncio.Semaphore(workers)
+    connector = aiohttp.TCPConnector(limit=workers)
+    timeout = aiohttp.ClientTimeout(total=None, connect=15, sock_read=60)
+
+    async def download(url, file_path, label):
+        nonlocal done, total_bytes
+        async with semaphore:
+            written = await stream_clip_to_file(session, url, file_path)
+        done += 1
+        if written is None:
+            failed.append(label)
+        else:
+            total_bytes += written
+        elapsed = max(time.time() - start, 0.001)
+        print(f"\r\033[K Clips {done}/{len(jobs)} • {format_file_size(total_bytes)} • {format_file_size(total_bytes / elapsed)}/s", end="", flush=True)
 
-    input("\nPress Enter to continue...")
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(download(url, file_path, label) for url, file_path, label in jobs))
+    print()
+    return failed
+
+
+def run_clip_downloads(jobs, download_directory):
+    if jobs:
+        failed = asyncio.run(download_clip_files(jobs))
+        for label in failed:
+            print(f"Failed to download {label}")
+        print(f"\nDownloaded {len(jobs) - len(failed)} of {len(jobs)} clip(s)")
+    print(f"\n\033[92m\u2713 Clips downloaded to {download_directory}\033[0m")
 
 
 def download_clips(directory, streamer_name, video_id):
@@ -3420,95 +4487,145 @@ def download_clips(directory, streamer_name, video_id):
         print("File is empty!")
         return
     mp4_links = [link for link in file_contents if os.path.basename(link).endswith(".mp4")]
+    jobs = []
     for link in mp4_links:
-        try:
-            response = requests.get(link, stream=False, timeout=30)
-            if response.status_code == 200:
-                offset = extract_offset(response.url)
-                file_name = f"{streamer_name.title()}_{video_id}_{offset}{get_default_video_format()}"
-                try:
-                    with open(os.path.join(download_directory, file_name), "wb") as x:
-                        print(f"Downloaded: {file_name}")
-                        x.write(response.content)
-                except ValueError:
-                    print(f"Failed to download... {response.url}")
-            else:
-                print(f"Failed to download.... {response.url}")
-        except Exception:
-            print(f"Failed to download.... {link}")
-            continue
-
-    print(f"\n\033[92m\u2713 Clips downloaded to {download_directory}\033[0m")
+        file_name = f"{streamer_name.title()}_{video_id}_{extract_offset(link)}{get_default_video_format()}"
+        jobs.append((link, os.path.join(download_directory, file_name), link))
+    run_clip_downloads(jobs, download_directory)
 
 
 def download_clips_gql(directory, streamer_name, video_id, slugs, prefetched_urls=None):
     download_directory = os.path.join(directory, f"{streamer_name.title()}_{video_id}")
     os.makedirs(download_directory, exist_ok=True)
+    jobs = []
     for i, slug in enumerate(slugs, 1):
-        try:
-            url = prefetched_urls[i - 1] if prefetched_urls and i - 1 < len(prefetched_urls) else get_twitch_clip(slug, retries=2)
-            if not url:
-                print(f"Skipping {slug} (could not get URL)")
-                continue
-            response = requests.get(url, stream=False, timeout=60)
-            if response.status_code == 200:
-                file_name = f"{streamer_name.title()}_{video_id}_{i:04d}_{slug[:40]}{get_default_video_format()}"
-                with open(os.path.join(download_directory, file_name), "wb") as x:
-                    print(f"Downloaded: {file_name}")
-                    x.write(response.content)
-            else:
-                print(f"Failed to download {slug}: HTTP {response.status_code}")
-        except Exception:
-            print(f"Failed to download {slug}")
+        url = prefetched_urls.get(slug) if prefetched_urls is not None else get_twitch_clip(slug, retries=2)
+        if not url:
+            print(f"Skipping {slug} (could not get URL)")
             continue
-    print(f"\n\033[92m\u2713 Clips downloaded to {download_directory}\033[0m")
+        file_name = f"{streamer_name.title()}_{video_id}_{i:04d}_{slug[:40]}{get_default_video_format()}"
+        jobs.append((url, os.path.join(download_directory, file_name), slug))
+    run_clip_downloads(jobs, download_directory)
 
 
-def get_ffmpeg_path():
-    try:
-        try:
+TOOL_REGISTRY = {}
+TOOL_REGISTRY_LOCK = threading.Lock()
 
-            if subprocess.run(["ffmpeg", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True).returncode == 0:
-                return "ffmpeg"
-        except Exception:
-            pass 
-        
-        if os.path.exists(ffdl.ffmpeg_path):
-            return ffdl.ffmpeg_path
 
-        raise Exception
+def get_tool_cache_path():
+    cache_dir = os.path.join(get_script_directory(), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "tools.json")
+
+
+def load_tool_cache():
+    try:
+        with open(get_tool_cache_path(), "r", encoding="utf-8") as tool_file:
+            return json.load(tool_file)
     except Exception:
-        sys.exit("FFmpeg not found! Please install FFmpeg correctly and try again.")
+        return {}
 
 
-def get_ffprobe_path():
+def write_tool_cache(cache):
     try:
-        try:
-            if subprocess.run(["ffprobe", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True).returncode == 0:
-                return "ffprobe"
-        except Exception:
-            pass
+        with open(get_tool_cache_path(), "w", encoding="utf-8") as tool_file:
+            json.dump(cache, tool_file, indent=4)
+    except Exception:
+        pass
+
+
+def probe_tool(name, path):
+    version_flag = "--version" if name == "yt-dlp" else "-version"
+    result = subprocess.run([path, version_flag], capture_output=True, text=True, timeout=30, check=True)
+    lines = result.stdout.strip().splitlines()
+    return {"path": path, "version": lines[0] if lines else ""}
+
 
-        if os.path.exists(ffdl.ffprobe_path):
-            return ffdl.ffprobe_path
+def resolve_tool(name, candidates):
+    with TOOL_REGISTRY_LOCK:
+        if name in TOOL_REGISTRY:
+            return TOOL_REGISTRY[name]
 
-        raise Exception
+        cache = load_tool_cache()
+        for candidate in candidates:
+            candidate = candidate() if callable(candidate) else candidate
+            if not candidate:
+                continue
+            path = candidate if os.path.isabs(candidate) and os.path.isfile(candidate) else shutil.which(candidate)
+            if not path:
+                continue
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            # A binary that has not been replaced since the last probe reports the same version
+            cached = cache.get(name)
+            if cached and cached.get("path") == path and cached.get("mtime") == mtime:
+                TOOL_REGISTRY[name] = cached
+                return cached
+
+            try:
+                tool = probe_tool(name, path)
+            except Exception:
+                continue
+            tool["mtime"] = mtime
+            cache[name] = tool
+            write_tool_cache(cache)
+            TOOL_REGISTRY[name] = tool
+            return tool
+        return None
+
+
+def forget_tool(name):
+    with TOOL_REGISTRY_LOCK:
+        TOOL_REGISTRY.pop(name, None)
+        cache = load_tool_cache()
+        if cache.pop(name, None) is not None:
+            write_tool_cache(cache)
+
+
+def get_bundled_ffmpeg_path(attribute):
+    try:
+        import ffmpeg_downloader as ffdl
+
+        return getattr(ffdl, attribute)
     except Exception:
-        sys.exit("FFprobe not found! Please install FFmpeg with FFprobe correctly and try again.")
+        return None
+
+
+def get_ffmpeg_path():
+    tool = resolve_tool("ffmpeg", ["ffmpeg", lambda: get_bundled_ffmpeg_path("ffmpeg_path")])
+    if tool:
+        return tool["path"]
+    sys.exit("FFmpeg not found! Please install FFmpeg correctly and try again.")
+
+
+def get_ffprobe_path():
+    tool = resolve_tool("ffprobe", ["ffprobe", lambda: get_bundled_ffmpeg_path("ffprobe_path")])
+    if tool:
+        return tool["path"]
+    sys.exit("FFprobe not found! Please install FFmpeg with FFprobe correctly and try again.")
 
 
 def get_yt_dlp_path():
+    tool = resolve_tool("yt-dlp", ["yt-dlp"])
+    if tool:
+        return tool["path"]
+
+    command = [sys.executable, "-m", "pip", "install", "yt-dlp", "--upgrade", "-q", "--disable-pip-version-check"]
     try:
-        if (subprocess.run(["yt-dlp", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True).returncode == 0):
-            return "yt-dlp"
+        subprocess.run(command, check=True)
     except Exception:
-        command = [sys.executable, "-m", "pip", "install", "yt-dlp", "--upgrade", "-q", "--disable-pip-version-check"]
+        sys.exit("yt-dlp not installed! Please install yt-dlp and try again.")
 
-        try:
-            subprocess.run(command, check=True)
-            return "yt-dlp"
-        except Exception:
-            sys.exit("yt-dlp not installed! Please install yt-dlp and try again.")
+    tool = resolve_tool("yt-dlp", ["yt-dlp"])
+    if tool:
+        return tool["path"]
+    # The scripts directory may not be on PATH yet, keep the old behaviour and let the caller try the bare name
+    with TOOL_REGISTRY_LOCK:
+        TOOL_REGISTRY["yt-dlp"] = {"path": "yt-dlp", "version": ""}
+    return "yt-dlp"
 
 
 def update_yt_dlp():
@@ -3524,7 +4641,9 @@ def update_yt_dlp():
             subprocess.run(command_stable, check=True)
         except Exception as e_stable:
             print(f"\n✖  Could not update yt-dlp: {e_stable}")
-    input("\nPress Enter to continue...")
+    # The upgraded binary has a new mtime, but this process must not keep using the stale entry
+    forget_tool("yt-dlp")
+    wait_for_enter("\nPress Enter to continue...")
 
 
 def get_short_filename(filename):
@@ -3553,35 +4672,252 @@ def format_file_size(n):
     return f"{n:.1f} {units[i]}"
 
 
+def sum_extinf_durations(lines):
+    total_duration = 0.0
+    for line in lines:
+        line = line.strip()
+        if line.startswith('#EXTINF:'):
+            # Extract duration from #EXTINF:duration,title
+            try:
+                total_duration += float(line[len('#EXTINF:'):].split(',')[0])
+            except ValueError:
+                continue
+    return total_duration
+
+
 def get_m3u8_duration(m3u8_source):
     try:
-        total_duration = 0.0
-        
         if m3u8_source.startswith(('http://', 'https://')):
-            response = requests.get(m3u8_source, timeout=30)
+            response = http_get(m3u8_source, timeout=30)
             response.raise_for_status()
             content = response.text
             lines = content.splitlines()
         else:
             with open(m3u8_source, 'r', encoding='utf-8', errors='ignore') as file:
                 lines = file.readlines()
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('#EXTINF:'):
-                # Extract duration from #EXTINF:duration,title
-                duration_str = line.split('#EXTINF:')[1].split(',')[0]
-                try:
-                    duration = float(duration_str)
-                    total_duration += duration
-                except ValueError:
-                    continue
-                    
+
+        total_duration = sum_extinf_durations(lines)
         return total_duration if total_duration > 0 else None
     except Exception:
         return None
 
 
+def read_m3u8_lines(m3u8_source):
+    if m3u8_source.startswith(('http://', 'https://')):
+        response = http_get(m3u8_source, timeout=30)
+        response.raise_for_status()
+        return response.text.splitlines()
+    with open(m3u8_source, 'r', encoding='utf-8', errors='ignore') as file:
+        return file.read().splitlines()
+
+
+def get_playlist_base_link(m3u8_source):
+    if m3u8_source.startswith(('http://', 'https://')):
+        return m3u8_source.rsplit('/', 1)[0] + '/'
+    return ''
+
+
+def parse_playlist_timeline(lines, base_link):
+    # Returns the #EXT-X-MAP init URI (if any) and (uri, start, duration) for every active segment
+    init_uri = None
+    segments = []
+    position = 0.0
+    pending_duration = None
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('#EXT-X-MAP') and 'URI=' in line:
+            raw_uri = line.split('URI=', 1)[1].split(',')[0].strip('"')
+            init_uri = ensure_absolute_uri(raw_uri, base_link)
+        elif line.startswith('#EXTINF:'):
+            try:
+                pending_duration = float(line[len('#EXTINF:'):].split(',')[0])
+            except ValueError:
+                pending_duration = 0.0
+        elif not line.startswith('#'):
+            duration = pending_duration or 0.0
+            segments.append((ensure_absolute_uri(line, base_link), position, duration))
+            position += duration
+            pending_duration = None
+
+    return init_uri, segments
+
+
+def get_segment_extension(segment_url, default='.ts'):
+    extension = os.path.splitext(urlparse(segment_url).path)[1]
+    return extension if extension else default
+
+
+async def fetch_segment_bytes(session, url, retries=3):
+    for attempt in range(retries):
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionResetError, OSError):
+            pass
+        if attempt != retries - 1:
+            await asyncio.sleep(1 + attempt)
+    return None
+
+
+async def spool_playlist_segments(indexed_urls, spool_dir, workers=SEGMENT_DOWNLOAD_WORKERS):
+    # Downloads (index, url) pairs into spool_dir once and returns {index: local_path}
+    spooled = {}
+    done = 0
+    semaphore = asyncio.Semaphore(workers)
+    connector = aiohttp.TCPConnector(limit=workers)
+    timeout = aiohttp.ClientTimeout(total=120, connect=10)
+
+    async def spool(index, url):
+        nonlocal done
+        async with semaphore:
+            data = await fetch_segment_bytes(session, url)
+        if data is not None:
+            local_path = os.path.join(spool_dir, f"{index:06d}{get_segment_extension(url)}")
+            with open(local_path, 'wb') as segment_file:
+                segment_file.write(data)
+            spooled[index] = local_path
+        done += 1
+        print(f"\rFetching segments {done}/{len(indexed_urls)}", end="", flush=True)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(spool(index, url) for index, url in indexed_urls))
+    print()
+    return spooled
+
+
+async def iter_segments_in_order(urls, workers=SEGMENT_DOWNLOAD_WORKERS):
+    # Fetches ahead concurrently but yields (index, data) strictly in playlist order
+    connector = aiohttp.TCPConnector(limit=workers)
+    timeout = aiohttp.ClientTimeout(total=120, connect=10)
+    pending = {}
+    next_index = 0
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        try:
+            for index in range(len(urls)):
+                while next_index < len(urls) and len(pending) < workers * 2:
+                    pending[next_index] = asyncio.create_task(fetch_segment_bytes(session, urls[next_index]))
+                    next_index += 1
+                yield index, await pending.pop(index)
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+
+async def pipe_segments_to_ffmpeg(m3u8_source, output_path):
+    init_uri, segments = parse_playlist_timeline(read_m3u8_lines(m3u8_source), get_playlist_base_link(m3u8_source))
+    if not segments:
+        print("\n✖  Playlist has no segments!")
+        return False
+
+    urls = [segment[0] for segment in segments]
+    if init_uri:
+        urls.insert(0, init_uri)
+
+    command = [
+        get_ffmpeg_path(),
+        "-hide_banner",
+        "-loglevel", "warning",
+        "-f", "mov" if init_uri else "mpegts",
+        "-i", "pipe:0",
+        "-c", "copy",
+        "-f", get_ffmpeg_format(get_default_video_format()),
+        "-y", output_path,
+    ]
+    process = await asyncio.create_subprocess_exec(*command, stdin=asyncio.subprocess.PIPE)
+
+    written = 0
+    try:
+        async for index, data in iter_segments_in_order(urls):
+            if data is None:
+                if init_uri and index == 0:
+                    raise Exception("Unable to download the #EXT-X-MAP init segment")
+                # A gap would silently shift everything after it, so the slower downloaders get a go instead
+                raise Exception(f"Segment {index + (0 if init_uri else 1)} of {len(segments)} could not be downloaded")
+            process.stdin.write(data)
+            await process.stdin.drain()
+            written += len(data)
+            print(f"\rSegments {index + 1}/{len(urls)} • {format_file_size(written)}", end="", flush=True)
+        process.stdin.close()
+    except BaseException:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        raise
+    print()
+
+    return await process.wait() == 0
+
+
+async def write_segments_to_file(urls, output_path, buffer_size=8 * 1024 * 1024):
+    written = 0
+    with open(output_path, "wb", buffering=buffer_size) as output_file:
+        async for index, data in iter_segments_in_order(urls):
+            if data is None:
+                # Stop at the gap, everything written so far is a clean prefix that can be resumed
+                print(f"\n\nSegment {index + 1} of {len(urls)} could not be downloaded")
+                return False
+            output_file.write(data)
+            written += len(data)
+            print(f"\rSegments {index + 1}/{len(urls)} • {format_file_size(written)}", end="", flush=True)
+    print()
+    return True
+
+
+def download_m3u8_direct_ts(m3u8_source, output_path):
+    # MPEG-TS segments can be concatenated byte for byte, so no ffmpeg process is needed
+    try:
+        init_uri, segments = parse_playlist_timeline(read_m3u8_lines(m3u8_source), get_playlist_base_link(m3u8_source))
+    except Exception as e:
+        print(f"\nUnable to read the playlist for a direct download: {str(e).strip()}")
+        return None
+    if init_uri or not segments:
+        return None
+
+    print(f"\nWriting {len(segments)} segments directly to the .ts file...\n")
+    try:
+        if asyncio.run(write_segments_to_file([segment[0] for segment in segments], output_path)):
+            return True
+    except Exception as e:
+        print(f"\nError: {str(e).strip()}")
+    return resume_partial_download(m3u8_source, output_path)
+
+
+def download_m3u8_native(m3u8_source, output_path):
+    print(f"\nDownloading segments with {SEGMENT_DOWNLOAD_WORKERS} connections and remuxing through ffmpeg...\n")
+    try:
+        if asyncio.run(pipe_segments_to_ffmpeg(m3u8_source, output_path)):
+            return True
+    except Exception as e:
+        print(f"\nError: {str(e).strip()}")
+    return resume_partial_download(m3u8_source, output_path)
+
+
+def write_local_playlist(playlist_path, entries, init_path=None):
+    target_duration = max((int(duration) + 1 for _, duration in entries), default=10)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:6" if init_path else "#EXT-X-VERSION:3",
+        f"#EXT-X-TARGETDURATION:{target_duration}",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+    ]
+    if init_path:
+        lines.append(f'#EXT-X-MAP:URI="{os.path.basename(init_path)}"')
+    for segment_path, duration in entries:
+        lines.append(f"#EXTINF:{duration:.3f},")
+        lines.append(os.path.basename(segment_path))
+    lines.append("#EXT-X-ENDLIST")
+    with open(playlist_path, 'w', encoding='utf-8') as playlist_file:
+        playlist_file.write("\n".join(lines) + "\n")
+
+
 def seconds_to_time_str(seconds):
     try:
         hours = int(seconds // 3600)
@@ -3592,24 +4928,28 @@ def seconds_to_time_str(seconds):
         return "00:00:00"
 
 
+def time_str_to_seconds(time_str):
+    parts = time_str.split(':')
+    hours = int(parts[0])
+    minutes = int(parts[1])
+    seconds = int(parts[2])
+    return hours * 3600 + minutes * 60 + seconds
+
+
 def calculate_slice_duration(start_time, end_time):
     try:
-        def time_to_seconds(time_str):
-            parts = time_str.split(':')
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = int(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        
-        start_seconds = time_to_seconds(start_time)
-        end_seconds = time_to_seconds(end_time)
-        
+        start_seconds = time_str_to_seconds(start_time)
+        end_seconds = time_str_to_seconds(end_time)
+
         return end_seconds - start_seconds if end_seconds > start_seconds else None
     except Exception:
         return None
 
 
 def handle_progress_bar(command, output_filename, m3u8_source, start_time=None, end_time=None):
+    from ffmpeg_progress_yield import FfmpegProgress
+    from tqdm import tqdm
+
     try:
         short_title = get_short_filename(output_filename)
         
@@ -3664,30 +5004,237 @@ def handle_progress_bar(command, output_filename, m3u8_source, start_time=None,
 
                 pbar.close()
         return True
-    except Exception as e:
-        print(f"Error: {str(e).strip()}")
-        raise Exception from e
+    except Exception as e:
+        print(f"Error: {str(e).strip()}")
+        raise Exception from e
+
+
+def handle_file_already_exists(output_path):
+    if os.path.exists(output_path):
+        if CLI_MODE:
+            return True
+        if not get_yes_no_choice(f'File already exists at "{output_path}". Do you want to redownload it?'):
+            print("\n\033[94m\u2713 Skipping download!\033[0m\n")
+            wait_for_enter()
+            return_to_main_menu()
+    return True
+
+
+def handle_retry_command(command):
+    try:
+        retry_command = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
+        print("Retrying command: " + retry_command)
+        subprocess.run(retry_command, shell=True, check=True, stdin=get_tool_stdin())
+        return True
+    except Exception:
+        return False
+
+
+def get_media_duration(file_path):
+    command = [
+        get_ffprobe_path(),
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        file_path,
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=60, check=False)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return float(result.stdout.strip().splitlines()[0])
+    except (subprocess.TimeoutExpired, ValueError, OSError):
+        return None
+
+
+def find_partial_output(output_path):
+    # yt-dlp keeps unfinished downloads in a .part file next to the final path
+    for candidate in (output_path, output_path + ".part"):
+        if os.path.isfile(candidate) and os.path.getsize(candidate) > 0:
+            return candidate
+    return None
+
+
+def concat_media_parts(part_paths, output_path):
+    base, ext = os.path.splitext(output_path)
+    list_path = f"{base}.concat.txt"
+    merged_path = f"{base}.merged{ext}"
+    with open(list_path, "w", encoding="utf-8") as list_file:
+        for part_path in part_paths:
+            escaped = os.path.abspath(part_path).replace("'", "'\\''")
+            list_file.write(f"file '{escaped}'\n")
+
+    command = [
+        get_ffmpeg_path(),
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", list_path,
+        "-c", "copy",
+        "-f", get_ffmpeg_format(get_default_video_format()),
+        "-y", merged_path,
+    ]
+    try:
+        subprocess.run(command, check=True, stdin=get_tool_stdin())
+        os.replace(merged_path, output_path)
+        for part_path in part_paths:
+            if os.path.exists(part_path) and os.path.abspath(part_path) != os.path.abspath(output_path):
+                os.remove(part_path)
+        return True
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"\n✖  Could not join the downloaded parts: {e}")
+        return False
+    finally:
+        if os.path.exists(list_path):
+            os.remove(list_path)
+
+
+def count_covered_segments(segments, covered):
+    # Whole segments fully inside the first `covered` seconds, a segment cut off mid-way is fetched again
+    count, boundary = 0, 0.0
+    for _, _, duration in segments:
+        if boundary + duration > covered + 0.25:
+            break
+        count += 1
+        boundary += duration
+    return count, boundary
+
+
+def trim_media_part(source_path, duration, part_path):
+    # Cutting the tail needs no keyframe, so the part ends exactly where the next segment starts
+    command = [
+        get_ffmpeg_path(),
+        "-hide_banner",
+        "-loglevel", "error",
+        "-i", source_path,
+        "-t", f"{duration:.3f}",
+        "-c", "copy",
+        "-f", "mpegts",
+        "-y", part_path,
+    ]
+    try:
+        subprocess.run(command, check=True, stdin=get_tool_stdin())
+        return True
+    except (subprocess.CalledProcessError, OSError):
+        return False
 
 
-def handle_file_already_exists(output_path):
-    if os.path.exists(output_path):
-        if CLI_MODE:
-            return True
-        if not get_yes_no_choice(f'File already exists at "{output_path}". Do you want to redownload it?'):
-            print("\n\033[94m\u2713 Skipping download!\033[0m\n")
-            input("Press Enter to continue...")
-            return_to_main_menu()
-    return True
+def write_resume_playlist(playlist_path, init_uri, segments, m3u8_source):
+    source_dir = os.path.dirname(os.path.abspath(m3u8_source)) if not m3u8_source.startswith(("http://", "https://")) else None
 
+    def resolve(uri):
+        if source_dir and not uri.startswith(("http://", "https://")) and not os.path.isabs(uri):
+            return os.path.join(source_dir, uri)
+        return uri
+
+    target_duration = max((int(duration) + 1 for _, _, duration in segments), default=10)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:6" if init_uri else "#EXT-X-VERSION:3",
+        f"#EXT-X-TARGETDURATION:{target_duration}",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+    ]
+    if init_uri:
+        lines.append(f'#EXT-X-MAP:URI="{resolve(init_uri)}"')
+    for uri, _, duration in segments:
+        lines.append(f"#EXTINF:{duration:.3f},")
+        lines.append(resolve(uri))
+    lines.append("#EXT-X-ENDLIST")
+    with open(playlist_path, "w", encoding="utf-8") as playlist_file:
+        playlist_file.write("\n".join(lines) + "\n")
+
+
+def resume_partial_download(m3u8_source, output_path, start_time=None, end_time=None, max_attempts=3):
+    # Continues from the first segment the partial file does not fully contain instead of seeking by time,
+    # which with stream copy snaps to a keyframe and duplicates or drops footage at the join
+    partial_path = find_partial_output(output_path)
+    if not partial_path:
+        return False
 
-def handle_retry_command(command):
     try:
-        retry_command = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
-        print("Retrying command: " + retry_command)
-        subprocess.run(retry_command, shell=True, check=True)
-        return True
+        init_uri, segments = parse_playlist_timeline(read_m3u8_lines(m3u8_source), get_playlist_base_link(m3u8_source))
     except Exception:
         return False
+    start_offset = time_str_to_seconds(start_time) if start_time else 0
+    end_offset = time_str_to_seconds(end_time) if end_time else None
+    segments = [
+        segment for segment in segments
+        if segment[1] + segment[2] > start_offset and (end_offset is None or segment[1] < end_offset)
+    ]
+    if not segments:
+        return False
+
+    # An .mp4 cut off before its moov atom cannot be probed, so there is nothing to resume from
+    partial_duration = get_media_duration(partial_path)
+    if not partial_duration:
+        print("\nThe partial download has no readable index (an interrupted .mp4 cannot be resumed).")
+        return False
+
+    # A slice's partial starts at start_offset, part way into the first segment
+    lead = start_offset - segments[0][1]
+    done, boundary = count_covered_segments(segments, partial_duration + lead)
+    if not done:
+        return False
+    base, ext = os.path.splitext(output_path)
+    parts = [f"{base}.part0.ts"]
+    if not trim_media_part(partial_path, boundary - lead, parts[0]):
+        return False
+
+    playlist_path = f"{base}.resume.m3u8"
+    completed = done == len(segments)
+    try:
+        for attempt in range(1, max_attempts + 1):
+            if completed:
+                break
+            remaining = segments[done:]
+            write_resume_playlist(playlist_path, init_uri, remaining, m3u8_source)
+
+            # Parts are MPEG-TS so an interrupted attempt can still be probed and kept
+            part_path = f"{base}.part{attempt}.ts"
+            command = [
+                get_ffmpeg_path(),
+                "-protocol_whitelist", "file,http,https,tcp,tls,crypto",
+                "-hide_banner",
+                "-loglevel", "warning",
+                "-stats",
+                "-i", playlist_path,
+            ]
+            if end_offset is not None:
+                command += ["-t", f"{end_offset - remaining[0][1]:.3f}"]
+            command += ["-c", "copy", "-f", "mpegts", "-y", part_path]
+
+            print(f"\nResuming download from segment {len(segments) - len(remaining) + 1}/{len(segments)} "
+                  f"at {seconds_to_time_str(remaining[0][1])} (attempt {attempt}/{max_attempts})...")
+            try:
+                subprocess.run(command, check=True, stdin=get_tool_stdin())
+                parts.append(part_path)
+                completed = True
+                break
+            except (subprocess.CalledProcessError, OSError):
+                pass
+
+            part_duration = get_media_duration(part_path) if os.path.exists(part_path) else None
+            count, boundary = count_covered_segments(remaining, part_duration or 0)
+            if count and trim_media_part(part_path, boundary, f"{base}.part{attempt}.kept.ts"):
+                os.replace(f"{base}.part{attempt}.kept.ts", part_path)
+                parts.append(part_path)
+                done += count
+            elif os.path.exists(part_path):
+                os.remove(part_path)
+    finally:
+        if os.path.exists(playlist_path):
+            os.remove(playlist_path)
+
+    if not completed or not concat_media_parts(parts, output_path):
+        for part_path in parts:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        return False
+    if partial_path != output_path and os.path.exists(partial_path):
+        os.remove(partial_path)
+    return True
 
 
 def is_m3u8_live(m3u8_link):
@@ -3695,7 +5242,7 @@ def is_m3u8_live(m3u8_link):
         parsed_url = urlparse(m3u8_link)
         if parsed_url.scheme in ("http", "https"):
             try:
-                response = requests.get(m3u8_link, timeout=15)
+                response = http_get(m3u8_link, timeout=15)
                 response.raise_for_status()
                 return all('#EXT-X-ENDLIST' not in line for line in response.text.splitlines())
             except Exception:
@@ -3719,6 +5266,14 @@ def download_m3u8_video_url(m3u8_link, output_filename, from_start=False):
 
     downloader = get_default_downloader()
 
+    if downloader != "yt-dlp":
+        is_live = is_m3u8_live(m3u8_link)
+        if not is_live and get_default_video_format() == ".ts":
+            if download_m3u8_direct_ts(m3u8_link, output_path):
+                return True
+        if not is_live and downloader == "native" and download_m3u8_native(m3u8_link, output_path):
+            return True
+        downloader = "ffmpeg"
 
     if downloader == "ffmpeg":
         command = [
@@ -3728,11 +5283,6 @@ def download_m3u8_video_url(m3u8_link, output_filename, from_start=False):
             "-stats",
         ]
 
-        is_live = is_m3u8_live(m3u8_link)
-
-        if CLI_MODE and CLI_DOWNLOAD_FROM_START:
-            from_start = True
-
         if is_live:
             if from_start:
                 command += ["-live_start_index", "0"]
@@ -3762,17 +5312,11 @@ def download_m3u8_video_url(m3u8_link, output_filename, from_start=False):
         if downloader == "ffmpeg" and get_use_progress_bar():
             handle_progress_bar(command, output_filename, m3u8_link)
         else:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, stdin=get_tool_stdin())
         return True
-    except Exception as e:
-        if downloader == "ffmpeg" and get_use_progress_bar():
-            try:
-                retry_cmd = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
-                subprocess.run(retry_cmd, shell=True, check=True)
-                if os.path.exists(output_path):
-                    return True
-            except Exception:
-                pass
+    except Exception:
+        if not is_m3u8_live(m3u8_link) and resume_partial_download(m3u8_link, output_path):
+            return True
         retry_success = handle_retry_command(command)
         if retry_success and os.path.exists(output_path):
             return True
@@ -3787,6 +5331,8 @@ def download_m3u8_video_url_slice(m3u8_link, output_filename, video_start_time,
     handle_file_already_exists(output_path)
 
     downloader = get_default_downloader()
+    if downloader == "native":
+        downloader = "ffmpeg"
 
     if downloader == "ffmpeg":
         
@@ -3821,17 +5367,11 @@ def download_m3u8_video_url_slice(m3u8_link, output_filename, video_start_time,
         if downloader == "ffmpeg" and get_use_progress_bar():
             handle_progress_bar(command, output_filename, m3u8_link, video_start_time, video_end_time)
         else:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, stdin=get_tool_stdin())
         return True
-    except Exception as e:
-        if downloader == "ffmpeg" and get_use_progress_bar():
-            try:
-                retry_cmd = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
-                subprocess.run(retry_cmd, shell=True, check=True)
-                if os.path.exists(output_path):
-                    return True
-            except Exception:
-                pass
+    except Exception:
+        if resume_partial_download(m3u8_link, output_path, video_start_time, video_end_time):
+            return True
         retry_success = handle_retry_command(command)
         if retry_success and os.path.exists(output_path):
             return True
@@ -3843,7 +5383,17 @@ def download_m3u8_video_file(m3u8_file_path, output_filename):
     handle_file_already_exists(output_path)
 
     downloader = get_default_downloader()
-    
+    source_path = m3u8_file_path
+
+    if downloader != "yt-dlp" and get_default_video_format() == ".ts":
+        if download_m3u8_direct_ts(m3u8_file_path, output_path):
+            return True
+    if downloader == "native":
+        if download_m3u8_native(m3u8_file_path, output_path):
+            return True
+        print("\nFalling back to ffmpeg...")
+        downloader = "ffmpeg"
+
     if downloader == "yt-dlp":
         if os.name == 'nt' and m3u8_file_path.startswith('\\\\'):
             m3u8_file_path = 'file://' + m3u8_file_path.replace('\\', '/')
@@ -3880,17 +5430,11 @@ def download_m3u8_video_file(m3u8_file_path, output_filename):
         if downloader == "ffmpeg" and get_use_progress_bar():
             handle_progress_bar(command, output_filename, m3u8_file_path)
         else:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, stdin=get_tool_stdin())
         return True
-    except Exception as e:
-        if downloader == "ffmpeg" and get_use_progress_bar():
-            try:
-                retry_cmd = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
-                subprocess.run(retry_cmd, shell=True, check=True)
-                if os.path.exists(output_path):
-                    return True
-            except Exception:
-                pass
+    except Exception:
+        if resume_partial_download(source_path, output_path):
+            return True
         retry_success = handle_retry_command(command)
         if retry_success and os.path.exists(output_path):
             return True
@@ -3931,17 +5475,11 @@ def download_m3u8_video_file_slice(m3u8_file_path, output_filename, video_start_
         if get_use_progress_bar():
             handle_progress_bar(command, output_filename, m3u8_file_path, video_start_time, video_end_time)
         else:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, stdin=get_tool_stdin())
         return True
-    except Exception as e:
-        if get_use_progress_bar():
-            try:
-                retry_cmd = ' '.join(f'"{part}"' if ' ' in part else part for part in command)
-                subprocess.run(retry_cmd, shell=True, check=True)
-                if os.path.exists(output_path):
-                    return True
-            except Exception:
-                pass
+    except Exception:
+        if resume_partial_download(m3u8_file_path, output_path, video_start_time, video_end_time):
+            return True
         retry_success = handle_retry_command(command)
         if retry_success and os.path.exists(output_path):
             return True
@@ -3978,19 +5516,19 @@ def handle_live_recording_fallback(channel_name, command, output_path):
         success = download_m3u8_video_url(m3u8_source, vod_filename, from_start=True)
         if success:
             print(f"\n\033[92m\u2713 Live recording saved to {os.path.join(get_default_directory(), vod_filename)}\033[0m\n")
-            input("Press Enter to continue...")
+            wait_for_enter()
             return True
     
     print("\033[91m \n✖  Unable to record stream from the beginning! \033[0m")
     
-    if get_yes_no_choice("Try to record from the current point?"):
+    if get_yes_no_choice("Try to record from the current point?", default=True):
         if "--live-from-start" in command:
             command.remove("--live-from-start")
         
         try:
-            subprocess.run(command, check=True)
+            subprocess.run(command, check=True, stdin=get_tool_stdin())
             print(f"\n\033[92m\u2713 Live recording saved to {output_path}\033[0m\n")
-            input("Press Enter to continue...")
+            wait_for_enter()
             return True
         except Exception as e:
             print(f"\n\033[94m\nError: {e}\033[0m")
@@ -4029,9 +5567,9 @@ def record_live_from_start(twitch_url=None):
     print("\nCommand: " + " ".join(command) + "\n")
     
     try:
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, stdin=get_tool_stdin())
         print(f"\n\033[92m✓ Live recording saved to {output_path}\033[0m\n")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return True
     except Exception:
         return handle_live_recording_fallback(channel_name, command, output_path)
@@ -4058,17 +5596,167 @@ def wait_and_record_stream(twitch_url=None):
 
     print("\nCommand: " + " ".join(command) + "\n")
     try:
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, stdin=get_tool_stdin())
         print(f"\n\033[92m✓ Recording saved to {output_path}\033[0m\n")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return True
     except Exception as e:
         print(f"\n\033[91m✖ Failed to record: {e}\033[0m\n")
         return False
 
 
+def parse_channel_list(value):
+    if os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as channel_file:
+            entries = channel_file.read().splitlines()
+    else:
+        entries = value.split(",")
+
+    channels = []
+    for entry in entries:
+        entry = entry.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        channels.append(get_twitch_channel_from_url(entry).lower())
+    return list(dict.fromkeys(channels))
+
+
+async def fetch_live_channels(session, logins):
+    # Returns {login: stream_id} for the live channels among logins, using one GQL request per batch
+    query = "query($logins: [String!]) { users(logins: $logins) { login stream { id } } }"
+    live = {}
+
+    async def fetch_batch(batch):
+        try:
+            async with session.post("https://gql.twitch.tv/gql", json={"query": query, "variables": {"logins": batch}}) as response:
+                if response.status != 200:
+                    return
+                data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return
+        for user in ((data or {}).get("data") or {}).get("users") or []:
+            if user and user.get("stream"):
+                live[user["login"].lower()] = user["stream"]["id"]
+
+    batches = [logins[i:i + WATCH_GQL_BATCH_SIZE] for i in range(0, len(logins), WATCH_GQL_BATCH_SIZE)]
+    await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    return live
+
+
+def lower_recording_priority():
+    # Runs in the forked child before exec, so only the recording (and its ffmpeg) runs at a lower CPU priority
+    try:
+        os.nice(10)
+    except Exception:
+        pass
+
+
+async def record_watched_channel(channel_name, semaphore, from_start):
+    async with semaphore:
+        # The command is exec'd without a shell, so the path goes in unquoted
+        output_filename = f"{channel_name} - Live - {datetime.now().strftime('%Y-%m-%d %H-%M-%S')}{get_default_video_format()}"
+        output_path = os.path.normpath(os.path.join(get_default_directory(), output_filename))
+
+        command = [get_yt_dlp_path(), f"https://www.twitch.tv/{channel_name}", "-o", output_path]
+        if from_start:
+            command.insert(1, "--live-from-start")
+        custom_options = get_yt_dlp_custom_options()
+        if custom_options:
+            command.extend(custom_options)
+
+        if os.name == 'nt':
+            process_options = {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+        else:
+            process_options = {"preexec_fn": lower_recording_priority}
+
+        print(f"\n\033[92m● {channel_name} is live, recording to {output_path}\033[0m")
+        process = await asyncio.create_subprocess_exec(*command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **process_options)
+        try:
+            return_code = await process.wait()
+        finally:
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+
+        if return_code == 0:
+            print(f"\n\033[92m✓ {channel_name} recording saved to {output_path}\033[0m")
+        else:
+            print(f"\n\033[91m✖ {channel_name} recording exited with code {return_code}\033[0m")
+        return return_code == 0
+
+
+async def watch_channels(channels, from_start=True, poll_seconds=None, max_recordings=None):
+    # One supervisor polls every channel per interval instead of one waiting yt-dlp process per channel
+    poll_seconds = poll_seconds or get_watch_poll_seconds()
+    semaphore = asyncio.Semaphore(max_recordings or get_max_concurrent_recordings())
+    recordings = {}
+    finished_streams = set()
+    # channel -> (stream_id, failed attempts, time of the next attempt), so a recording that keeps failing backs off
+    failures = {}
+    headers = {"Client-ID": "ue6666qo983tsx6so1t0vnawi233wa"}
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    print(f"\nWatching {len(channels)} channel(s), checking every {poll_seconds}s. Press Ctrl+C to stop.")
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        try:
+            while True:
+                for channel_name, (stream_id, task) in list(recordings.items()):
+                    if task.done():
+                        del recordings[channel_name]
+                        if not task.cancelled() and task.exception() is None and task.result():
+                            finished_streams.add(stream_id)
+                            failures.pop(channel_name, None)
+                            continue
+                        previous_id, attempts, _ = failures.get(channel_name, (stream_id, 0, 0))
+                        attempts = attempts + 1 if previous_id == stream_id else 1
+                        if attempts >= WATCH_MAX_RETRIES:
+                            print(f"\n\033[91m✖ {channel_name} failed to record {attempts} times, skipping this stream\033[0m")
+                            finished_streams.add(stream_id)
+                            failures.pop(channel_name, None)
+                            continue
+                        delay = min(poll_seconds * 2 ** attempts, WATCH_RETRY_MAX_SECONDS)
+                        failures[channel_name] = (stream_id, attempts, time.monotonic() + delay)
+                        print(f"\n{channel_name} will be retried in {seconds_to_time_str(delay)}")
+
+                live = await fetch_live_channels(session, channels)
+                for channel_name, stream_id in live.items():
+                    if channel_name in recordings or stream_id in finished_streams:
+                        continue
+                    failed_id, _, retry_at = failures.get(channel_name, (None, 0, 0))
+                    if failed_id == stream_id and time.monotonic() < retry_at:
+                        continue
+                    task = asyncio.create_task(record_watched_channel(channel_name, semaphore, from_start))
+                    recordings[channel_name] = (stream_id, task)
+
+                await asyncio.sleep(poll_seconds)
+        finally:
+            for _, task in recordings.values():
+                task.cancel()
+            await asyncio.gather(*(task for _, task in recordings.values()), return_exceptions=True)
+
+
+def watch_channels_menu():
+    value = input("\nEnter channel names separated by commas, or the path of a file with one per line: ").strip().replace('"', "")
+    channels = parse_channel_list(value) if value else []
+    if not channels:
+        print("\n✖  No channels entered!")
+        return
+    from_start = get_yes_no_choice("Record each stream from the start?")
+    try:
+        asyncio.run(watch_channels(channels, from_start=from_start))
+    except KeyboardInterrupt:
+        print("\n\nStopped watching channels.")
+
+
+def watch_channels_cli(value, from_start=False):
+    channels = parse_channel_list(value)
+    if not channels:
+        raise SystemExit("Error: --watch-channels needs at least one channel.")
+    asyncio.run(watch_channels(channels, from_start=from_start))
+
+
 def record_live_menu(twitch_url=None):
-    print("\n1) Record Stream\n2) Wait and record when stream starts\n3) Return")
+    print("\n1) Record Stream\n2) Wait and record when stream starts\n3) Watch multiple channels\n4) Return")
     while True:
         choice = input("\nChoose an option: ").strip()
         if choice == "1":
@@ -4076,6 +5764,8 @@ def record_live_menu(twitch_url=None):
         if choice == "2":
             return wait_and_record_stream(twitch_url)
         if choice == "3":
+            return watch_channels_menu()
+        if choice == "4":
             return
         print("\n✖  Invalid option! Please Try Again.")
 
@@ -4103,7 +5793,7 @@ def record_live_cli(twitch_url, from_start=False):
     print("\nCommand: " + " ".join(command) + "\n")
 
     try:
-        subprocess.run(command, check=True)
+        subprocess.run(command, check=True, stdin=get_tool_stdin())
         print(f"\n\033[92m Live recording saved to {output_path}\033[0m\n")
     except Exception as exc:
         raise SystemExit(f"Error: Live recording failed ({exc}).") from exc
@@ -4142,8 +5832,7 @@ def get_VLC_Location():
                         config_data = json.load(config_file)
 
                     config_data["VLC_LOCATION"] = location
-                    with open(config_file_path, "w", encoding="utf-8") as config_file:
-                        json.dump(config_data, config_file, indent=4)
+                    write_config_file(config_file_path, config_data)
                 except (FileNotFoundError, json.JSONDecodeError) as error:
                     print(f"Error: {error}")
                 return location
@@ -4153,7 +5842,7 @@ def get_VLC_Location():
         return None
 
 
-def handle_vod_url_normal(m3u8_source, title=None, stream_date=None):
+def handle_vod_url_normal(m3u8_source, title=None, stream_date=None, from_start=False):
     is_file = os.path.isfile(m3u8_source)
 
     if is_file:
@@ -4167,7 +5856,7 @@ def handle_vod_url_normal(m3u8_source, title=None, stream_date=None):
     else:
         vod_filename = get_filename_for_url_source(m3u8_source, title=title, stream_date=stream_date)
 
-        success = download_m3u8_video_url(m3u8_source, vod_filename)
+        success = download_m3u8_video_url(m3u8_source, vod_filename, from_start=from_start)
         if not success:
             print(f"\n\033[91m\u2717 Failed to download Vod: {vod_filename}\033[0m\n")
             return False
@@ -4248,6 +5937,135 @@ def handle_vod_url_trim(m3u8_source, title=None, stream_date=None, start_time=No
     return True
 
 
+def parse_time_ranges(value, allow_file=True):
+    if allow_file and os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as ranges_file:
+            entries = ranges_file.read().splitlines()
+    else:
+        entries = value.split(",")
+
+    ranges = []
+    for entry in entries:
+        entry = entry.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        match = re.match(r"^(\d+:[0-5]\d:[0-5]\d)\s*(?:-|\s)\s*(\d+:[0-5]\d:[0-5]\d)$", entry)
+        if not match:
+            raise ValueError(f"Invalid time range '{entry}', expected HH:MM:SS-HH:MM:SS")
+        start_time, end_time = match.groups()
+        if time_str_to_seconds(end_time) <= time_str_to_seconds(start_time):
+            raise ValueError(f"Time range '{entry}' ends before it starts")
+        ranges.append((start_time, end_time))
+
+    if not ranges:
+        raise ValueError("No time ranges provided")
+    return ranges
+
+
+def export_range_from_spool(playlist_path, offset_seconds, start_seconds, end_seconds, output_path):
+    command = [
+        get_ffmpeg_path(),
+        "-protocol_whitelist", "file,crypto",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-ss", f"{max(start_seconds - offset_seconds, 0):.3f}",
+        "-to", f"{end_seconds - offset_seconds:.3f}",
+        "-i", playlist_path,
+        "-c", "copy",
+        "-f", get_ffmpeg_format(get_default_video_format()),
+        "-y", output_path,
+    ]
+    subprocess.run(command, check=True, stdin=subprocess.DEVNULL)
+    return output_path
+
+
+def handle_vod_url_multi_trim(m3u8_source, ranges, title=None, stream_date=None):
+    if get_default_downloader() == "yt-dlp":
+        print("Using ffmpeg, because yt-dlp doesn't natively support exporting several ranges at once")
+
+    is_file = os.path.isfile(m3u8_source)
+    try:
+        lines = read_m3u8_lines(m3u8_source)
+    except Exception as e:
+        print(f"\n\033[91m✗ Unable to read playlist: {e}\033[0m\n")
+        return False
+
+    init_uri, segments = parse_playlist_timeline(lines, get_playlist_base_link(m3u8_source))
+    if not segments:
+        print("\n\033[91m✗ Playlist has no segments!\033[0m\n")
+        return False
+
+    exports = []
+    skipped_ranges = 0
+    for start_time, end_time in ranges:
+        raw_start_time = start_time.replace(":", ".")
+        raw_end_time = end_time.replace(":", ".")
+        if is_file:
+            vod_filename = get_filename_for_file_trim(m3u8_source, title, stream_date, raw_start_time, raw_end_time)
+        else:
+            vod_filename = get_filename_for_url_trim(m3u8_source, title, stream_date, raw_start_time, raw_end_time)
+        output_path = os.path.normpath(os.path.join(get_default_directory(), vod_filename))
+        handle_file_already_exists(output_path)
+
+        start_seconds = time_str_to_seconds(start_time)
+        end_seconds = time_str_to_seconds(end_time)
+        indices = [index for index, (_, segment_start, duration) in enumerate(segments) if segment_start < end_seconds and segment_start + duration > start_seconds]
+        if not indices:
+            print(f"\n✖  Range {start_time}-{end_time} is outside of the VOD, skipping")
+            skipped_ranges += 1
+            continue
+        exports.append((vod_filename, output_path, start_seconds, end_seconds, indices))
+
+    if not exports:
+        return False
+
+    # Overlapping ranges share the same spooled segment files
+    needed = sorted({index for *_, indices in exports for index in indices})
+    spool_dir = tempfile.mkdtemp(prefix="vodrecovery_ranges_", dir=get_default_directory())
+    try:
+        print(f"\nFetching {len(needed)} segments for {len(exports)} range(s)...")
+        indexed_urls = [(index, segments[index][0]) for index in needed]
+        if init_uri:
+            indexed_urls.insert(0, (-1, init_uri))
+        spooled = asyncio.run(spool_playlist_segments(indexed_urls, spool_dir))
+        init_path = spooled.pop(-1, None)
+        if init_uri and not init_path:
+            print("\n\033[91m✗ Unable to fetch the init segment!\033[0m\n")
+            return False
+
+        futures = {}
+        with ThreadPoolExecutor(max_workers=min(len(exports), 4)) as executor:
+            for number, (vod_filename, output_path, start_seconds, end_seconds, indices) in enumerate(exports):
+                # The cut times assume a gapless timeline, so a range with a missing segment cannot be exported correctly
+                missing = [index for index in indices if index not in spooled]
+                if missing:
+                    print(f"\n\033[91m✗ {len(missing)} of {len(indices)} segments could not be fetched for {vod_filename}\033[0m")
+                    continue
+                entries = [(spooled[index], segments[index][2]) for index in indices]
+                playlist_path = os.path.join(spool_dir, f"range_{number}.m3u8")
+                write_local_playlist(playlist_path, entries, init_path)
+                offset_seconds = segments[indices[0]][1]
+                future = executor.submit(export_range_from_spool, playlist_path, offset_seconds, start_seconds, end_seconds, output_path)
+                futures[future] = vod_filename
+
+            success = len(futures) == len(exports) and not skipped_ranges
+            for future in as_completed(futures):
+                vod_filename = futures[future]
+                try:
+                    future.result()
+                    print(f"\033[92m✓ Vod downloaded to {os.path.join(get_default_directory(), vod_filename)}\033[0m")
+                except Exception as e:
+                    success = False
+                    print(f"\033[91m✗ Failed to download Vod: {vod_filename} ({e})\033[0m")
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    if success and is_file:
+        os.remove(m3u8_source)
+    print()
+    return success
+
+
 def get_filename_for_file_trim(m3u8_source, title, stream_date, raw_start_time, raw_end_time):
     streamer_name, video_id = parse_vod_filename(m3u8_source)
     formatted_date = format_date(stream_date) if stream_date else None
@@ -4325,11 +6143,11 @@ def handle_download_menu(link, title=None, stream_datetime=None):
         start_download = print_confirm_download_menu()
         if start_download == 1:
             handle_vod_url_normal(link, title, stream_datetime)
-            input("Press Enter to continue...")
+            wait_for_enter()
             return_to_main_menu()
         elif start_download == 2:
             handle_vod_url_trim(link, title, stream_datetime)
-            input("Press Enter to continue...")
+            wait_for_enter()
             return_to_main_menu()
         elif start_download == 3 and vlc_location:
             if os.path.isfile(link):
@@ -4368,24 +6186,28 @@ def play_m3u8_with_vlc(m3u8_source):
     return True
 
 
+ID3_DATE_PATTERN = re.compile(r"#ID3-EQUIV-TDTG:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})")
+
+
+def parse_m3u8_stream_date(lines):
+    date = None
+    total_seconds = 0
+    for line in lines:
+        date_match = ID3_DATE_PATTERN.match(line)
+        if date_match:
+            date = date_match.group(1)
+        if line.startswith("#EXT-X-TWITCH-TOTAL-SECS:"):
+            total_seconds = int(float(line.split(":")[-1].strip()))
+    if date is None:
+        return None
+    adjusted_date = datetime.strptime(date, "%Y-%m-%dT%H:%M:%S") - timedelta(seconds=total_seconds)
+    return adjusted_date.strftime("%Y-%m-%d")
+
+
 def get_datetime_from_m3u8(m3u8_file):
     try:
-        date = None
-        total_seconds = 0
-        date_pattern = re.compile(r"#ID3-EQUIV-TDTG:(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})")
-
         with open(m3u8_file, "r", encoding="utf-8") as f:
-            for line in f:
-                date_match = date_pattern.match(line)
-                if date_match:
-                    date = date_match.group(1)
-                if line.startswith("#EXT-X-TWITCH-TOTAL-SECS:"):
-                    total_seconds = int(float(line.split(":")[-1].strip()))
-        if date is not None:
-            date = datetime.strptime(date, "%Y-%m-%dT%H:%M:%S")
-            adjusted_date = date - timedelta(seconds=total_seconds)
-            adjusted_date_str = adjusted_date.strftime("%Y-%m-%d")
-            return adjusted_date_str
+            return parse_m3u8_stream_date(f)
     except Exception:
         pass
 
@@ -4484,7 +6306,7 @@ def generate_m3u8_from_segments(base_url, segment_duration=10.0):
         for attempt in range(retries):
             try:
                 url = f"{base_url}{n}.ts"
-                resp = requests.head(url, timeout=10)
+                resp = http_head(url, retry=False, timeout=10)
                 return resp.status_code == 200
             except Exception:
                 if attempt < retries - 1:
@@ -4535,8 +6357,9 @@ def fetch_twitch_data(vod_id, retries=3, delay=5):
     attempt = 0
     while attempt < retries:
         try:
-            res = requests.post(
+            res = http_post(
                 "https://gql.twitch.tv/gql",
+                retry=False,
                 json={
                     "query": f'query {{ video(id: "{vod_id}") {{ title, broadcastType, createdAt, seekPreviewsURL, owner {{ login }} }} }}'
                 },
@@ -4561,7 +6384,7 @@ def fetch_twitch_data(vod_id, retries=3, delay=5):
 def get_vod_or_highlight_url(vod_id):
     print(f"\nSearching URL for Vod {vod_id}...")
     url = f"https://usher.ttvnw.net/vod/{vod_id}.m3u8"
-    response = requests.get(url, timeout=30)
+    response = http_get(url, timeout=30)
     if response.status_code != 200:
         data = fetch_twitch_data(vod_id)
 
@@ -4606,7 +6429,7 @@ def get_vod_or_highlight_url(vod_id):
                 url = f"https://{domain}/{vod_special_id}/chunked/index-dvr.m3u8"
 
             if url is not None:
-                response = requests.get(url, timeout=30)
+                response = http_get(url, timeout=30)
                 if response.status_code == 200:
                     return url, vod_data.get("title"), vod_data.get("createdAt")
                 elif response.status_code in (403, 404, 410):
@@ -4632,12 +6455,12 @@ def get_vod_or_highlight_url(vod_id):
     return response.url, None, None
 
 
-def twitch_recover(link=None):
+def twitch_recover(link=None, from_start=False):
     url = link if link else print_get_twitch_url_menu()
 
     if is_twitch_livestream_url(url):
         if CLI_MODE:
-            return record_live_cli(url, CLI_DOWNLOAD_FROM_START)
+            return record_live_cli(url, from_start)
         return record_live_menu(url)
     
     vod_id = extract_id_from_url(url)
@@ -4649,7 +6472,7 @@ def twitch_recover(link=None):
         print("   - https://twitchtracker.com")
         print("   - https://streamscharts.com")
         print("   - https://sullygnome.com\n")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return_to_main_menu()
 
     try:
@@ -4664,7 +6487,7 @@ def twitch_recover(link=None):
         print("   - https://twitchtracker.com")
         print("   - https://streamscharts.com")
         print("   - https://sullygnome.com\n")
-        input("Press Enter to continue...")
+        wait_for_enter()
         return_to_main_menu()
 
     print(f"\n\033[92m\u2713 Found URL: {m3u8_url}\n\033[0m")
@@ -4673,40 +6496,45 @@ def twitch_recover(link=None):
     return handle_download_menu(m3u8_source, title=title, stream_datetime=format_datetime)
 
 
+def build_clip_render_status_query(clip_slug):
+    return {
+        "operationName": "ShareClipRenderStatus",
+        "variables": {
+            "slug": clip_slug,
+        },
+        "extensions": {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": "1844261bb449fa51e6167040311da4a7a5f1c34fe71c71a3e0c4f551bc30c698",
+            }
+        },
+    }
+
+
+def build_clip_url(clip_data):
+    playback_access_token = clip_data["playbackAccessToken"]
+    return (
+        clip_data["videoQualities"][0]["sourceURL"]
+        + "?sig=" + playback_access_token["signature"]
+        + "&token=" + requests.utils.quote(playback_access_token["value"])
+    )
+
+
 def get_twitch_clip(clip_slug, retries=3):
     url_endpoint = "https://gql.twitch.tv/gql"
-    data = [
-        {
-            "operationName": "ShareClipRenderStatus",
-            "variables": {
-                "slug": clip_slug,
-            },
-            "extensions": {
-                "persistedQuery": {
-                    "version": 1,
-                    "sha256Hash": "1844261bb449fa51e6167040311da4a7a5f1c34fe71c71a3e0c4f551bc30c698",
-                }
-            },
-        }
-    ]
+    data = [build_clip_render_status_query(clip_slug)]
     headers = {"Client-Id": "ue6666qo983tsx6so1t0vnawi233wa"}
     
     for attempt in range(retries):
         try:
-            response_endpoint = requests.post(url_endpoint, json=data, headers=headers, timeout=30)
+            response_endpoint = http_post(url_endpoint, json=data, headers=headers, retry=False, timeout=30)
             response_endpoint.raise_for_status()
             response = response_endpoint.json()
 
             if "error" in response or "errors" in response:
                 raise ValueError(response.get("message", "Unable to get clip!"))
 
-            playback_access_token = response[0]["data"]["clip"]["playbackAccessToken"]
-            url = (
-                response[0]["data"]["clip"]["videoQualities"][0]["sourceURL"]
-                + "?sig=" + playback_access_token["signature"]
-                + "&token=" + requests.utils.quote(playback_access_token["value"])
-            )
-            return url
+            return build_clip_url(response[0]["data"]["clip"])
 
         except (requests.exceptions.RequestException, ValueError):
             print("\nRetrying...")
@@ -4719,10 +6547,65 @@ def get_twitch_clip(clip_slug, retries=3):
     return None
 
 
+async def fetch_clip_url_batch(session, slugs, retries=3):
+    # GQL answers a batched request with one result per operation, in request order
+    data = [build_clip_render_status_query(slug) for slug in slugs]
+    for attempt in range(retries):
+        try:
+            async with session.post("https://gql.twitch.tv/gql", json=data) as response:
+                if response.status == 200:
+                    results = await response.json()
+                    if isinstance(results, list) and len(results) == len(slugs):
+                        clip_urls = {}
+                        for slug, result in zip(slugs, results):
+                            try:
+                                clip_urls[slug] = build_clip_url(result["data"]["clip"])
+                            except (KeyError, IndexError, TypeError):
+                                continue
+                        return clip_urls
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        if attempt != retries - 1:
+            await asyncio.sleep(1 + attempt)
+    return {}
+
+
+async def resolve_clip_urls(slugs, batch_size=CLIP_GQL_BATCH_SIZE, concurrency=CLIP_GQL_CONCURRENCY, quiet=False):
+    clip_urls = {}
+    done = 0
+    batches = [slugs[i:i + batch_size] for i in range(0, len(slugs), batch_size)]
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = {"Client-Id": "ue6666qo983tsx6so1t0vnawi233wa"}
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async def resolve(batch):
+        nonlocal done
+        async with semaphore:
+            clip_urls.update(await fetch_clip_url_batch(session, batch))
+        done += len(batch)
+        if not quiet:
+            print(f"\r\033[K Fetching clip URLs {done}/{len(slugs)} • {len(clip_urls)} found", end="", flush=True)
+
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        await asyncio.gather(*(resolve(batch) for batch in batches))
+    if not quiet:
+        print()
+    return clip_urls
+
+
+def get_twitch_clip_urls(slugs, quiet=False):
+    # Returns {slug: url} for every slug that resolved, preserving slug order
+    unique_slugs = list(dict.fromkeys(slugs))
+    if not unique_slugs:
+        return {}
+    clip_urls = asyncio.run(resolve_clip_urls(unique_slugs, quiet=quiet))
+    return {slug: clip_urls[slug] for slug in unique_slugs if slug in clip_urls}
+
+
 def twitch_clip_downloader(clip_url, slug, streamer):
     print("\nDownloading Clip...")
     try:
-        response = requests.get(clip_url, stream=True, timeout=30)
+        response = http_get(clip_url, stream=True, timeout=30)
         if response.status_code != 200:
             raise Exception("Unable to download clip!")
         download_location = os.path.join(get_default_directory(), f"{streamer}-{slug}{get_default_video_format()}")
@@ -4733,7 +6616,7 @@ def twitch_clip_downloader(clip_url, slug, streamer):
         print(f"\n\033[92m\u2713 Clip downloaded to {download_location}\033[0m\n")
 
         if not CLI_MODE:
-            input("Press Enter to continue...")
+            wait_for_enter()
         return True
     except Exception:
         raise Exception("Unable to download clip!")
@@ -4750,8 +6633,21 @@ def _validate_cli_time(value, label):
         raise SystemExit(f"Error: {label} must be in HH:MM:SS format.")
 
 
+def _parse_cli_ranges(args, start_time, end_time, watch_mode):
+    ranges_value = (getattr(args, "ranges", None) or "").strip()
+    if not ranges_value:
+        return None
+    if start_time or end_time:
+        raise SystemExit("Error: --ranges cannot be combined with --start/--end.")
+    if watch_mode:
+        raise SystemExit("Error: --watch cannot be combined with --ranges.")
+    try:
+        return parse_time_ranges(ranges_value, allow_file=getattr(args, "ranges_from_file", True))
+    except ValueError as e:
+        raise SystemExit(f"Error: {e}.")
+
+
 def download_url_cli(args):
-    global CLI_DOWNLOAD_FROM_START
     url = (args.url or "").strip()
     if not url:
         raise SystemExit("Error: --url requires a valid URL.")
@@ -4772,6 +6668,7 @@ def download_url_cli(args):
 
     _validate_cli_time(start_time, "--start")
     _validate_cli_time(end_time, "--end")
+    ranges = _parse_cli_ranges(args, start_time, end_time, watch_mode)
 
     if not url.startswith("https://"):
         url = "https://" + url
@@ -4821,20 +6718,12 @@ def download_url_cli(args):
             play_m3u8_with_vlc(m3u8_source)
             return
 
-        if start_time and end_time:
-            previous_flag = CLI_DOWNLOAD_FROM_START
-            CLI_DOWNLOAD_FROM_START = from_start_flag
-            try:
-                success = handle_vod_url_trim(m3u8_source, title=title, stream_date=stream_datetime, start_time=start_time, end_time=end_time)
-            finally:
-                CLI_DOWNLOAD_FROM_START = previous_flag
+        if ranges:
+            success = handle_vod_url_multi_trim(m3u8_source, ranges, title=title, stream_date=stream_datetime)
+        elif start_time and end_time:
+            success = handle_vod_url_trim(m3u8_source, title=title, stream_date=stream_datetime, start_time=start_time, end_time=end_time)
         else:
-            previous_flag = CLI_DOWNLOAD_FROM_START
-            CLI_DOWNLOAD_FROM_START = from_start_flag
-            try:
-                success = handle_vod_url_normal(m3u8_source, title=title, stream_date=stream_datetime)
-            finally:
-                CLI_DOWNLOAD_FROM_START = previous_flag
+            success = handle_vod_url_normal(m3u8_source, title=title, stream_date=stream_datetime, from_start=from_start_flag)
 
         if not success:
             raise SystemExit("Error: Download failed.")
@@ -4864,6 +6753,7 @@ def download_m3u8_cli(args):
 
     _validate_cli_time(start_time, "--start")
     _validate_cli_time(end_time, "--end")
+    ranges = _parse_cli_ranges(args, start_time, end_time, watch_mode)
 
     if not (m3u8_url.startswith("http://") or m3u8_url.startswith("https://")):
         m3u8_url = "https://" + m3u8_url
@@ -4880,7 +6770,9 @@ def download_m3u8_cli(args):
     title = None
     stream_datetime = None
 
-    if start_time and end_time:
+    if ranges:
+        success = handle_vod_url_multi_trim(m3u8_source, ranges, title=title, stream_date=stream_datetime)
+    elif start_time and end_time:
         success = handle_vod_url_trim(m3u8_source, title=title, stream_date=stream_datetime, start_time=start_time, end_time=end_time)
     else:
         success = handle_vod_url_normal(m3u8_source, title=title, stream_date=stream_datetime)
@@ -4889,6 +6781,270 @@ def download_m3u8_cli(args):
         raise SystemExit("Error: Download failed.")
 
 
+def run_recovery_job(args):
+    if args.clip_url:
+        handle_twitch_clip(args.clip_url)
+    elif getattr(args, "m3u8", None):
+        download_m3u8_cli(args)
+    elif args.url:
+        download_url_cli(args)
+    else:
+        raise SystemExit("Error: A job needs a url, m3u8 or clip.")
+
+
+JOB_FIELDS = {"url": "url", "m3u8": "m3u8", "clip": "clip_url", "start": "start_time", "end": "end_time", "ranges": "ranges", "from_start": "from_start"}
+
+
+def build_job_args(params):
+    if not isinstance(params, dict):
+        raise ValueError("Job must be a JSON object")
+    unknown = sorted(set(params) - set(JOB_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown job fields: {', '.join(unknown)}")
+    if sum(1 for key in ("url", "m3u8", "clip") if params.get(key)) != 1:
+        raise ValueError("Job needs exactly one of url, m3u8 or clip")
+
+    values = {dest: None for dest in JOB_FIELDS.values()}
+    for key, dest in JOB_FIELDS.items():
+        if key not in params:
+            continue
+        value = params[key]
+        if key == "from_start":
+            # bool("false") is True, so only real JSON booleans are accepted
+            if not isinstance(value, bool):
+                raise ValueError("from_start must be true or false")
+            values[dest] = value
+        elif isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise ValueError(f"{key} must be a string")
+        else:
+            values[dest] = str(value)
+    values["from_start"] = bool(values["from_start"])
+    # VLC playback needs a desktop session, so watch mode is never offered over the API.
+    # Ranges must be inline too, a file path would let any client read lines of local files through the error
+    return argparse.Namespace(watch=False, watch_channels=None, ranges_from_file=False, **values)
+
+
+class JobServer:
+    def __init__(self, workers=JOB_WORKERS, history=SERVE_JOB_HISTORY):
+        self.jobs = {}
+        self.history = history
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self.started = time.time()
+
+    def submit(self, params, label=None):
+        args = build_job_args(params)
+        job_id = uuid.uuid4().hex[:12]
+        job = {"id": job_id, "label": label or job_id, "params": params, "status": "queued", "error": None, "created": time.time(), "started": None, "finished": None}
+        with self.lock:
+            self.jobs[job["id"]] = job
+            self.prune()
+        self.executor.submit(self.run, job, args)
+        return dict(job)
+
+    def run(self, job, args):
+        job["status"], job["started"] = "running", time.time()
+        JOB_CONTEXT.label, JOB_CONTEXT.line_start = job["label"], True
+        try:
+            run_recovery_job(args)
+            job["status"] = "done"
+        except SystemExit as e:
+            # The CLI helpers report failures through SystemExit, a clean exit still counts as done
+            if e.code in (None, 0):
+                job["status"] = "done"
+            else:
+                job["status"], job["error"] = "failed", str(e.code)
+        except ReturnToMain:
+            job["status"], job["error"] = "failed", "Unable to process job"
+        except Exception as e:
+            job["status"], job["error"] = "failed", str(e) or e.__class__.__name__
+        finally:
+            job["finished"] = time.time()
+            print(f"\nJob {job['status']}" + (f": {job['error']}" if job["error"] else ""))
+            JOB_CONTEXT.label = None
+
+    def prune(self):
+        if self.history is None:
+            return
+        finished = [job for job in self.jobs.values() if job["finished"]]
+        for job in sorted(finished, key=lambda item: item["finished"])[:max(0, len(finished) - self.history)]:
+            del self.jobs[job["id"]]
+
+    def get(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def all_jobs(self):
+        with self.lock:
+            return [dict(job) for job in sorted(self.jobs.values(), key=lambda item: item["created"])]
+
+    def status(self):
+        with self.lock:
+            counts = {}
+            for job in self.jobs.values():
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+        return {
+            "version": CURRENT_VERSION,
+            "uptime": round(time.time() - self.started, 1),
+            "jobs": counts,
+            "tools": {name: tool.get("version") for name, tool in TOOL_REGISTRY.items()},
+            "browser_sessions": len(BROWSER_POOL.sessions) if BROWSER_POOL else 0,
+        }
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    server_version = f"VodRecovery/{CURRENT_VERSION}"
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path == "/status":
+            return self.send_json(200, self.server.jobs.status())
+        if path == "/jobs":
+            return self.send_json(200, self.server.jobs.all_jobs())
+        if path.startswith("/jobs/"):
+            job = self.server.jobs.get(path[len("/jobs/"):])
+            return self.send_json(200, job) if job else self.send_json(404, {"error": "Job not found"})
+        self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self.send_json(404, {"error": "Not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError("Invalid Content-Length")
+            body = self.rfile.read(length)
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+        except OSError:
+            return self.send_json(400, {"error": "Could not read the request body"})
+        try:
+            job = self.server.jobs.submit(json.loads(body or b"{}"))
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+        self.send_json(202, job)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def parse_serve_address(value):
+    host, _, port = (value or SERVE_ADDRESS).rpartition(":")
+    try:
+        return host or "127.0.0.1", int(port)
+    except ValueError:
+        raise SystemExit("Error: --serve expects HOST:PORT.")
+
+
+def serve_jobs_cli(value, workers=None):
+    global CLI_MODE
+    CLI_MODE = True
+    enable_non_interactive()
+    host, port = parse_serve_address(value)
+
+    # Warm the shared pools once so the first job does not pay for them
+    get_settings()
+    get_http_session()
+
+    server = ThreadingHTTPServer((host, port), JobRequestHandler)
+    server.daemon_threads = True
+    server.jobs = JobServer(workers or JOB_WORKERS)
+    print(f"Serving jobs on http://{host}:{port} (POST /jobs, GET /jobs/<id>, GET /status)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        server.jobs.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def classify_batch_source(source):
+    lowered = source.lower()
+    if "/clip/" in lowered or "clips.twitch.tv" in lowered:
+        return "clip"
+    if ".m3u8" in lowered:
+        return "m3u8"
+    return "url"
+
+
+def parse_batch_file(path):
+    # One source per line, optionally followed by START END, blank lines and # comments are skipped
+    items, errors = [], []
+    with open(path, "r", encoding="utf-8") as batch_file:
+        for line_number, line in enumerate(batch_file, 1):
+            parts = line.strip().replace('"', "").split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            if len(parts) not in (1, 3):
+                errors.append(f"line {line_number}: expected URL or URL START END")
+                continue
+            params = {classify_batch_source(parts[0]): parts[0]}
+            if len(parts) == 3:
+                if not all(re.match(r"^\d{2}:\d{2}:\d{2}$", value) for value in parts[1:]):
+                    errors.append(f"line {line_number}: START and END must be HH:MM:SS")
+                    continue
+                params["start"], params["end"] = parts[1], parts[2]
+            items.append((line_number, params))
+    if errors:
+        raise SystemExit("Error: Invalid batch file:\n  " + "\n  ".join(errors))
+    return items
+
+
+def run_batch_cli(path, workers=None):
+    path = path.strip().strip('"')
+    if not os.path.isfile(path):
+        raise SystemExit(f"Error: Batch file not found: {path}")
+    items = parse_batch_file(path)
+    if not items:
+        raise SystemExit("Error: --batch file has no URLs.")
+
+    enable_non_interactive()
+    workers = workers or JOB_WORKERS
+    runner = JobServer(workers, history=None)
+    print(f"Processing {len(items)} items with {workers} workers...")
+    start = time.time()
+
+    submitted = []
+    for line_number, params in items:
+        try:
+            job = runner.submit(params, label=f"line {line_number}")
+        except ValueError as e:
+            job = {"id": None, "params": params, "status": "failed", "error": str(e), "started": None, "finished": None}
+        submitted.append((line_number, job))
+    runner.executor.shutdown(wait=True)
+
+    results, counts = [], {}
+    for line_number, job in submitted:
+        job = runner.get(job["id"]) if job["id"] else job
+        kind = next(key for key in ("url", "m3u8", "clip") if key in job["params"])
+        counts[job["status"]] = counts.get(job["status"], 0) + 1
+        results.append({
+            "line": line_number,
+            "type": kind,
+            "source": job["params"][kind],
+            "status": job["status"],
+            "error": job["error"],
+            "seconds": round(job["finished"] - job["started"], 1) if job["started"] and job["finished"] else None,
+        })
+
+    results_path = os.path.splitext(path)[0] + ".results.json"
+    summary = {"file": path, "workers": workers, "seconds": round(time.time() - start, 1), "counts": counts, "items": results}
+    with open(results_path, "w", encoding="utf-8") as results_file:
+        json.dump(summary, results_file, indent=4)
+
+    print(f"\n{counts.get('done', 0)} done, {counts.get('failed', 0)} failed. Results saved to {results_path}")
+    if counts.get("failed"):
+        raise SystemExit(1)
+
+
 def fetch_stream_data(channel_name: str, vod_id: str = None):
     try:
         if vod_id:
@@ -4917,7 +7073,7 @@ def fetch_stream_data(channel_name: str, vod_id: str = None):
 
         payload = {"query": query, "variables": variables}
 
-        res = requests.post(
+        res = http_post(
             "https://gql.twitch.tv/gql",
             json=payload,
             headers={
@@ -4939,6 +7095,12 @@ def fetch_stream_data(channel_name: str, vod_id: str = None):
         latest_videos_edges = ((user.get("videos") or {}).get("edges") or [])
         targeted_video = data.get("video") or {}
 
+        for edge in latest_videos_edges:
+            vod_node = (edge or {}).get("node") or {}
+            vod_path = extract_vod_path(channel_name.lower(), vod_node.get("previewThumbnailURL"), vod_node.get("animatedPreviewURL"))
+            if vod_path:
+                remember_vod_path(split_vod_path(vod_path, channel_name.lower())[0], vod_path)
+
         last_broadcast_id = last_broadcast.get("id")
         last_broadcast_started_at = last_broadcast.get("startedAt")
         stream_id = current_stream.get("id")
@@ -5056,7 +7218,7 @@ def run_vod_recover():
                     m3u8_file_path = file_path.strip()
 
                     handle_file_download_menu(m3u8_file_path)
-                    input("Press Enter to continue...")
+                    wait_for_enter()
 
                 elif download_type == 3:
                     twitch_recover()
@@ -5077,7 +7239,7 @@ def run_vod_recover():
                         if get_yes_no_choice("Do you want to unmute the video so it can be played in media players?"):
                             print()
                             unmute_vod(url)
-                            input("Press Enter to continue...")
+                            wait_for_enter()
                         else:
                             print("\nReturning to main menu...")
                             continue
@@ -5089,7 +7251,7 @@ def run_vod_recover():
                 elif mode == 3:
                     url = print_get_m3u8_link_menu()
                     unmute_vod(url)
-                    input("Press Enter to continue...")
+                    wait_for_enter()
                 elif mode == 4:
                     continue
             elif menu == 7:
@@ -5112,12 +7274,12 @@ def run_vod_recover():
                         if os.path.exists(config_file_path):
                             print(f"Opening {config_file_path}...")
                             open_file(config_file_path)
-                            input("\nPress Enter to continue...")
+                            wait_for_enter("\nPress Enter to continue...")
                         else:
                             print("File not found!")
                     elif options_choice == 7:
                         print_help()
-                        input("Press Enter to continue...")
+                        wait_for_enter()
                     elif options_choice == 8:
                         break
             elif menu == 8:
@@ -5136,20 +7298,27 @@ if __name__ == "__main__":
     parser.add_argument("--clip", dest="clip_url", help="Download Twitch clip by URL")
     parser.add_argument("--start", dest="start_time", help="Trim start time HH:MM:SS for VOD download")
     parser.add_argument("--end", dest="end_time", help="Trim end time HH:MM:SS for VOD download")
+    parser.add_argument("--ranges", dest="ranges", help="Export several HH:MM:SS-HH:MM:SS ranges in one pass (comma separated, or a file with one range per line)")
     parser.add_argument("--watch", dest="watch", action="store_true", help="Open the stream in VLC instead of downloading")
     parser.add_argument("--from-start", dest="from_start", action="store_true", help="Attempt to record live channel from the beginning")
+    parser.add_argument("--watch-channels", dest="watch_channels", help="Record channels whenever they go live (comma separated names, or a file with one per line)")
+    parser.add_argument("--batch", dest="batch", help="Process a file of URLs (Twitch, trackers, M3U8, clips), one per line with optional START END, and write FILE.results.json")
+    parser.add_argument("--workers", dest="workers", type=int, help=f"Parallel jobs for --batch and --serve (default {JOB_WORKERS})")
+    parser.add_argument("--serve", dest="serve", nargs="?", const=SERVE_ADDRESS, help=f"Run a local job server that keeps pools and caches warm (default {SERVE_ADDRESS})")
 
     args = parser.parse_args()
 
-    if any([args.url, args.clip_url, getattr(args, "m3u8", None)]):
+    if any([args.url, args.clip_url, getattr(args, "m3u8", None), args.watch_channels, args.serve, args.batch]):
         try:
             CLI_MODE = True
-            if args.clip_url:
-                handle_twitch_clip(args.clip_url)
-            elif getattr(args, "m3u8", None):
-                download_m3u8_cli(args)
-            elif args.url:
-                download_url_cli(args)
+            if args.serve:
+                serve_jobs_cli(args.serve, workers=args.workers)
+            elif args.batch:
+                run_batch_cli(args.batch, workers=args.workers)
+            elif args.watch_channels:
+                watch_channels_cli(args.watch_channels, from_start=args.from_start)
+            else:
+                run_recovery_job(args)
         except KeyboardInterrupt:
             print("\n\nExiting...")
             os._exit(0)